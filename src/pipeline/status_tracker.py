@@ -9,10 +9,11 @@ Tracks progress across document processing tasks with:
 Based on L208 lines 809-826 (Task Coordination Mechanisms - Progress Tracking)
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
 import time
+import weakref
 
 
 class TaskStatus(Enum):
@@ -24,8 +25,22 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
-class TaskProgress:
+# Enum.value is a descriptor lookup; resolve each status string once.
+# Members are singletons, so hot paths compare statuses with `is`.
+_STATUS_VALUES = {status: status.value for status in TaskStatus}
+
+
+class _WeakReferenceable:
+    """Slot-only base that gives slotted subclasses a ``__weakref__`` slot.
+
+    ``dataclass(weakref_slot=True)`` needs Python 3.11; inheriting the slot
+    works on 3.10 too, so ``StatusTracker(weak_refs=True)`` can hold tasks.
+    """
+    __slots__ = ('__weakref__',)
+
+
+@dataclass(slots=True)
+class TaskProgress(_WeakReferenceable):
     """Progress information for a task
 
     Based on L208 lines 810-825 (Progress Tracking implementation)
@@ -84,11 +99,27 @@ class StatusTracker:
     Based on L208 lines 809-826 (Progress Tracking)
     """
 
-    def __init__(self):
-        """Initialize status tracker"""
-        self.tasks: Dict[str, TaskProgress] = {}
+    def __init__(self, weak_refs: bool = False):
+        """Initialize status tracker
+
+        Args:
+            weak_refs: Hold tasks by weak reference, so a task stops being
+                       tracked as soon as its owner drops it (no
+                       clear_completed() scan needed). Callers must keep a
+                       reference to every TaskProgress they want tracked.
+        """
+        self.tasks: MutableMapping[str, TaskProgress] = (
+            weakref.WeakValueDictionary() if weak_refs else {}
+        )
         self.task_hierarchy: Dict[str, List[str]] = {}  # parent_id -> [child_ids]
 
+        # Bumped by every mutating method; lets get_aggregate_status reuse
+        # its last result while nothing has changed. Only task IDs and
+        # counters are cached, never TaskProgress objects, so the cache
+        # cannot keep weakly held tasks alive.
+        self._version = 0
+        self._aggregate_cache: Optional[Tuple] = None
+
     def create_task(
         self,
         task_id: str,
@@ -115,6 +146,7 @@ class StatusTracker:
         )
 
         self.tasks[task_id] = progress
+        self._version += 1
 
         # Track hierarchy
         if parent_task_id:
@@ -134,6 +166,7 @@ class StatusTracker:
             task = self.tasks[task_id]
             task.status = TaskStatus.IN_PROGRESS
             task.started_at = time.time()
+            self._version += 1
 
     def update_progress(
         self,
@@ -152,6 +185,7 @@ class StatusTracker:
             return
 
         task = self.tasks[task_id]
+        self._version += 1
 
         if items_completed is not None:
             task.items_completed = items_completed
@@ -175,6 +209,7 @@ class StatusTracker:
             task.completed_at = time.time()
             task.progress_percent = 100.0
             task.items_completed = task.items_total
+            self._version += 1
 
             if result is not None:
                 task.metadata['result'] = result
@@ -191,6 +226,7 @@ class StatusTracker:
             task.status = TaskStatus.FAILED
             task.completed_at = time.time()
             task.error_message = error_message
+            self._version += 1
 
     def cancel_task(self, task_id: str) -> None:
         """Cancel a task
@@ -202,6 +238,7 @@ class StatusTracker:
             task = self.tasks[task_id]
             task.status = TaskStatus.CANCELLED
             task.completed_at = time.time()
+            self._version += 1
 
     def get_task_status(self, task_id: str) -> Optional[TaskProgress]:
         """Get status of a specific task
@@ -217,45 +254,75 @@ class StatusTracker:
     def get_aggregate_status(self, task_ids: List[str]) -> Dict[str, Any]:
         """Get aggregated status across multiple tasks
 
+        Counts are cached until the next tracker method call that changes
+        task state. Update tasks through the tracker (start_task,
+        update_progress, ...); assigning to a returned TaskProgress directly
+        is not seen by a cached result.
+
         Args:
             task_ids: List of task IDs to aggregate
 
         Returns:
             Dictionary with aggregate statistics
         """
-        tasks = [self.tasks[tid] for tid in task_ids if tid in self.tasks]
-
-        if not tasks:
-            return {'error': 'No valid tasks found'}
-
-        total_items = sum(t.items_total for t in tasks)
-        completed_items = sum(t.items_completed for t in tasks)
-
-        status_counts = {
-            'pending': sum(1 for t in tasks if t.status == TaskStatus.PENDING),
-            'in_progress': sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS),
-            'completed': sum(1 for t in tasks if t.status == TaskStatus.COMPLETED),
-            'failed': sum(1 for t in tasks if t.status == TaskStatus.FAILED),
-            'cancelled': sum(1 for t in tasks if t.status == TaskStatus.CANCELLED)
-        }
-
-        # Calculate overall progress
-        overall_progress = (completed_items / total_items * 100) if total_items > 0 else 0
+        # Task count is part of the key so weakly held tasks that have been
+        # reclaimed since the last call invalidate the cache
+        key = (self._version, len(self.tasks), tuple(task_ids))
+        cached = self._aggregate_cache
+
+        if cached is None or cached[0] != key:
+            tasks = [self.tasks[tid] for tid in task_ids if tid in self.tasks]
+
+            if not tasks:
+                return {'error': 'No valid tasks found'}
+
+            total_items = 0
+            completed_items = 0
+            counts = dict.fromkeys(TaskStatus, 0)
+            in_progress_ids = []
+
+            # Single pass over tasks instead of one scan per status
+            for t in tasks:
+                total_items += t.items_total
+                completed_items += t.items_completed
+                counts[t.status] += 1
+                if t.status is TaskStatus.IN_PROGRESS:
+                    in_progress_ids.append(t.task_id)
+
+            status_counts = {_STATUS_VALUES[status]: n for status, n in counts.items()}
+
+            # Calculate overall progress
+            overall_progress = (completed_items / total_items * 100) if total_items > 0 else 0
+
+            summary = {
+                'total_tasks': len(tasks),
+                'status_counts': status_counts,
+                'total_items': total_items,
+                'completed_items': completed_items,
+                'overall_progress_percent': overall_progress
+            }
+            cached = (key, summary, tuple(in_progress_ids))
+            self._aggregate_cache = cached
+
+        _, summary, in_progress_ids = cached
+        in_progress_tasks = [
+            task for task in map(self.tasks.get, in_progress_ids) if task is not None
+        ]
 
-        # Estimate remaining time (average across in-progress tasks)
-        in_progress_tasks = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
+        # Estimate remaining time (average across in-progress tasks). Always
+        # recomputed: estimates depend on wall-clock time, not just state.
         if in_progress_tasks:
-            estimates = [t.estimated_remaining for t in in_progress_tasks if t.estimated_remaining]
+            estimates = [
+                remaining for remaining in (t.estimated_remaining for t in in_progress_tasks)
+                if remaining
+            ]
             avg_remaining = sum(estimates) / len(estimates) if estimates else None
         else:
             avg_remaining = None
 
         return {
-            'total_tasks': len(tasks),
-            'status_counts': status_counts,
-            'total_items': total_items,
-            'completed_items': completed_items,
-            'overall_progress_percent': overall_progress,
+            **summary,
+            'status_counts': dict(summary['status_counts']),
             'estimated_remaining_seconds': avg_remaining
         }
 
@@ -283,17 +350,35 @@ class StatusTracker:
         if root_task_id not in self.tasks:
             return {}
 
-        task = self.tasks[root_task_id]
-        children = self.get_child_tasks(root_task_id)
-
-        return {
-            'task_id': task.task_id,
-            'status': task.status.value,
-            'progress_percent': task.progress_percent,
-            'elapsed_time': task.elapsed_time,
-            'estimated_remaining': task.estimated_remaining,
-            'children': [self.get_task_tree(child.task_id) for child in children]
-        }
+        # Iterative pre-order walk: each stack entry carries the list its
+        # node belongs in, so deep hierarchies never hit the recursion limit.
+        # Children are pushed in reverse so they are attached in order.
+        tasks = self.tasks
+        hierarchy = self.task_hierarchy
+        roots: List[Dict] = []
+        stack = [(root_task_id, roots)]
+
+        while stack:
+            task_id, siblings = stack.pop()
+            task = tasks[task_id]
+            children: List[Dict] = []
+
+            siblings.append({
+                'task_id': task.task_id,
+                'status': _STATUS_VALUES[task.status],
+                'progress_percent': task.progress_percent,
+                'elapsed_time': task.elapsed_time,
+                'estimated_remaining': task.estimated_remaining,
+                'children': children
+            })
+
+            child_ids = hierarchy.get(task_id)
+            if child_ids:
+                stack.extend(
+                    (cid, children) for cid in reversed(child_ids) if cid in tasks
+                )
+
+        return roots[0]
 
     def clear_completed(self) -> int:
         """Remove completed tasks from tracking
@@ -303,15 +388,19 @@ class StatusTracker:
         """
         completed_ids = [
             tid for tid, task in self.tasks.items()
-            if task.status == TaskStatus.COMPLETED
+            if task.status is TaskStatus.COMPLETED
         ]
 
+        if not completed_ids:
+            return 0
+
         for tid in completed_ids:
             del self.tasks[tid]
+        self._version += 1
 
-            # Clean up hierarchy
-            for parent_id, children in self.task_hierarchy.items():
-                if tid in children:
-                    children.remove(tid)
+        # Clean up hierarchy in one pass rather than once per removed task
+        removed = set(completed_ids)
+        for children in self.task_hierarchy.values():
+            children[:] = [cid for cid in children if cid not in removed]
 
         return len(completed_ids)
@@ -9,10 +9,60 @@ Breaks complex documents into hierarchical subtasks for:
 Based on L208 lines 649-798 (Task Decomposition Patterns)
 """
 
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Iterator, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import hashlib
+from collections import Counter
+from concurrent.futures import Executor
+import asyncio
+import inspect
+import itertools
+import re
+
+
+# Maximal run of non-whitespace, matching the words produced by str.split()
+_WORD_PATTERN = re.compile(r'\S+')
+
+
+def _window_spans(
+    starts: List[int],
+    ends: List[int],
+    window: int,
+    stride: int
+) -> Iterator[Tuple[int, int]]:
+    """Compute character spans of word windows
+
+    Window i covers words [i*stride, i*stride + window), clipped to the last
+    word; windows stop once one reaches the end of the text. The boundary
+    offsets are gathered with strided list slices, so no per-window index
+    arithmetic runs in Python bytecode.
+
+    Args:
+        starts: Word start offsets
+        ends: Word end offsets
+        window: Words per window
+        stride: Words between consecutive window starts
+
+    Returns:
+        Iterator of (start, end) character offsets
+    """
+    if stride < 1:
+        raise ValueError("Chunk stride must be positive (overlap must be less than chunk_size)")
+
+    word_count = len(starts)
+    if not word_count:
+        return iter(())
+
+    # Number of windows until one covers the final word
+    window_count = 1 + max(0, -(-(word_count - window) // stride))
+
+    window_starts = starts[:(window_count - 1) * stride + 1:stride]
+    window_ends = ends[window - 1::stride][:window_count]
+    if len(window_ends) < window_count:
+        # Final window is clipped to the last word
+        window_ends.append(ends[-1])
+
+    return zip(window_starts, window_ends)
 
 
 class ChunkingStrategy(Enum):
@@ -22,7 +72,7 @@ class ChunkingStrategy(Enum):
     CONTEXT_AWARE = "context_aware"     # Split with overlap for context preservation
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentTask:
     """Represents a task in the processing hierarchy
 
@@ -78,6 +128,7 @@ class TaskDecomposer:
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.tasks: Dict[str, DocumentTask] = {}
+        self._task_counter = itertools.count()
 
     def decompose(
         self,
@@ -97,43 +148,79 @@ class TaskDecomposer:
         Returns:
             List of tasks (single task if no decomposition needed)
         """
+        return list(self.iter_decompose(document_id, content, threshold))
+
+    def iter_decompose(
+        self,
+        document_id: str,
+        content: str,
+        threshold: Optional[int] = None
+    ) -> Iterator[DocumentTask]:
+        """Decompose document, yielding tasks as chunks are produced
+
+        The parent task is yielded first, followed by one child task per
+        chunk. Chunks are generated lazily, so only the chunk currently being
+        turned into a task is held outside the task registry. The parent's
+        (and children's) ``total_chunks`` metadata is filled in once the last
+        child has been yielded.
+
+        Args:
+            document_id: Document identifier
+            content: Document content
+            threshold: Size threshold for decomposition (uses chunk_size if None)
+
+        Yields:
+            Parent task, then child tasks (single leaf task if no decomposition needed)
+        """
         threshold = threshold or self.chunk_size
         content_size = len(content.split())  # Word count
 
         if content_size <= threshold:
             # No decomposition needed
-            task = self._create_task(document_id, content, is_leaf=True)
-            return [task]
+            yield self._create_task(document_id, content, is_leaf=True)
+            return
 
         # Decompose based on strategy
         if self.chunking_strategy == ChunkingStrategy.FIXED_SIZE:
-            chunks = self._fixed_size_chunking(content)
+            chunks = self._iter_fixed_size_chunks(content)
         elif self.chunking_strategy == ChunkingStrategy.SEMANTIC:
-            chunks = self._semantic_chunking(content)
+            chunks = self._iter_semantic_chunks(content)
         else:  # CONTEXT_AWARE
-            chunks = self._context_aware_chunking(content)
+            chunks = self._iter_context_aware_chunks(content)
 
         # Create parent task
-        parent_task = self._create_task(
-            document_id,
-            content,
-            is_leaf=False,
-            metadata={'total_chunks': len(chunks)}
-        )
+        parent_task = self._create_task(document_id, content, is_leaf=False)
+        yield parent_task
+
+        # Create child tasks as chunks are produced. Tasks are built inline
+        # rather than through _create_task(); they are still registered one
+        # at a time so the registry stays in step with what has been yielded.
+        tasks = self.tasks
+        generate_task_id = self._generate_task_id
+        parent_task_id = parent_task.task_id
+        child_prefix = f"{document_id}_chunk_"
+        child_metadata = []
 
-        # Create child tasks
-        child_tasks = []
         for i, chunk in enumerate(chunks):
-            child_task = self._create_task(
-                f"{document_id}_chunk_{i}",
-                chunk,
-                parent_task_id=parent_task.task_id,
-                is_leaf=True,
-                metadata={'chunk_index': i, 'total_chunks': len(chunks)}
+            child_document_id = f"{child_prefix}{i}"
+            task_id = generate_task_id()
+            metadata = {'chunk_index': i, 'is_leaf': True}
+            child_task = DocumentTask(
+                task_id=task_id,
+                document_id=child_document_id,
+                content=chunk,
+                parent_task_id=parent_task_id,
+                metadata=metadata
             )
-            child_tasks.append(child_task)
+            tasks[task_id] = child_task
+            child_metadata.append(metadata)
+            yield child_task
 
-        return [parent_task] + child_tasks
+        # Chunk count is only known once the stream is exhausted
+        total_chunks = len(child_metadata)
+        parent_task.metadata['total_chunks'] = total_chunks
+        for metadata in child_metadata:
+            metadata['total_chunks'] = total_chunks
 
     def aggregate_results(
         self,
@@ -160,7 +247,6 @@ class TaskDecomposer:
 
         elif aggregation_strategy == "voting":
             # Majority vote (for classification tasks)
-            from collections import Counter
             votes = Counter(child_results)
             return votes.most_common(1)[0][0] if votes else None
 
@@ -174,6 +260,42 @@ class TaskDecomposer:
             # Default: return list of results
             return child_results
 
+    def aggregate_incremental(
+        self,
+        parent_task_id: str,
+        new_result: Any,
+        aggregation_strategy: str = "voting"
+    ) -> Any:
+        """Fold a single child result into the parent's running aggregate
+
+        Streaming counterpart to aggregate_results(): running state is kept
+        in the parent task's metadata, so each call costs O(1) instead of
+        rebuilding the aggregate from every child result seen so far.
+
+        Args:
+            parent_task_id: Parent task identifier
+            new_result: Result from one newly completed child task
+            aggregation_strategy: How to combine results (voting, weighted_average)
+
+        Returns:
+            Aggregate over all results folded in so far
+        """
+        metadata = self.tasks[parent_task_id].metadata
+
+        if aggregation_strategy == "voting":
+            votes = metadata.setdefault('_vote_counter', Counter())
+            votes[new_result] += 1
+            return votes.most_common(1)[0][0]
+
+        elif aggregation_strategy == "weighted_average":
+            running_sum, count = metadata.get('_running_average', (0.0, 0))
+            running_sum += new_result
+            count += 1
+            metadata['_running_average'] = (running_sum, count)
+            return running_sum / count
+
+        raise ValueError(f"Unsupported incremental aggregation: {aggregation_strategy}")
+
     def _create_task(
         self,
         document_id: str,
@@ -194,7 +316,7 @@ class TaskDecomposer:
         Returns:
             Created DocumentTask
         """
-        task_id = self._generate_task_id(document_id, parent_task_id)
+        task_id = self._generate_task_id()
 
         metadata = metadata or {}
         metadata['is_leaf'] = is_leaf
@@ -210,21 +332,40 @@ class TaskDecomposer:
         self.tasks[task_id] = task
         return task
 
-    def _generate_task_id(self, document_id: str, parent_id: Optional[str]) -> str:
+    def _generate_task_id(self) -> str:
         """Generate unique task ID
 
-        Args:
-            document_id: Document identifier
-            parent_id: Parent task ID if applicable
+        IDs only need to be unique within this decomposer, so a monotonic
+        counter is used instead of hashing. itertools.count is safe to
+        advance from the worker threads used by RecursiveTaskProcessor.
 
         Returns:
             Unique task ID
         """
-        unique_str = f"{document_id}_{parent_id or 'root'}_{len(self.tasks)}"
-        hash_suffix = hashlib.sha256(unique_str.encode()).hexdigest()[:8]
-        return f"task_{hash_suffix}"
+        return f"task_{next(self._task_counter):08x}"
 
-    def _fixed_size_chunking(self, content: str) -> List[str]:
+    def _word_spans(self, content: str) -> Tuple[List[int], List[int]]:
+        """Locate word boundaries in content
+
+        Chunks are sliced straight out of the original string using these
+        offsets, so words are never re-joined into new strings.
+
+        Args:
+            content: Content to scan
+
+        Returns:
+            Tuple of (word start offsets, word end offsets)
+        """
+        starts = []
+        ends = []
+        add_start = starts.append
+        add_end = ends.append
+        for match in _WORD_PATTERN.finditer(content):
+            add_start(match.start())
+            add_end(match.end())
+        return starts, ends
+
+    def _iter_fixed_size_chunks(self, content: str) -> Iterator[str]:
         """Split content by fixed size
 
         Based on L208 lines 730-734 (Fixed-Size Chunking)
@@ -232,19 +373,16 @@ class TaskDecomposer:
         Args:
             content: Content to chunk
 
-        Returns:
-            List of chunks
+        Yields:
+            Chunks of at most chunk_size words
         """
-        words = content.split()
-        chunks = []
-
-        for i in range(0, len(words), self.chunk_size):
-            chunk = " ".join(words[i:i + self.chunk_size])
-            chunks.append(chunk)
+        chunk_size = self.chunk_size
+        starts, ends = self._word_spans(content)
 
-        return chunks
+        for start, end in _window_spans(starts, ends, chunk_size, chunk_size):
+            yield content[start:end]
 
-    def _semantic_chunking(self, content: str) -> List[str]:
+    def _iter_semantic_chunks(self, content: str) -> Iterator[str]:
         """Split content by semantic boundaries
 
         Based on L208 lines 736-739 (Semantic Chunking)
@@ -252,35 +390,44 @@ class TaskDecomposer:
         Args:
             content: Content to chunk
 
-        Returns:
-            List of chunks
+        Yields:
+            Chunks of whole paragraphs
         """
         # Split by paragraphs (double newline)
         paragraphs = content.split('\n\n')
 
-        chunks = []
-        current_chunk = []
+        # Word count per paragraph via C-level map() instead of a split call
+        # in the loop body. str.split() is kept (not a space count) so
+        # paragraphs with line breaks or repeated spaces are sized exactly.
+        para_sizes = map(len, map(str.split, paragraphs))
+
+        # Paragraphs are contiguous in content, so a chunk is a single slice
+        # from the first included paragraph to the end of the last one
+        chunk_size = self.chunk_size
+        chunk_start = 0
+        chunk_end = 0
+        para_start = 0
         current_size = 0
+        has_chunk = False
 
-        for para in paragraphs:
-            para_size = len(para.split())
-
-            if current_size + para_size > self.chunk_size and current_chunk:
+        for para, para_size in zip(paragraphs, para_sizes):
+            if current_size + para_size > chunk_size and has_chunk:
                 # Start new chunk
-                chunks.append("\n\n".join(current_chunk))
-                current_chunk = [para]
+                yield content[chunk_start:chunk_end]
+                chunk_start = para_start
                 current_size = para_size
             else:
-                current_chunk.append(para)
                 current_size += para_size
 
-        # Add remaining chunk
-        if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
+            has_chunk = True
+            chunk_end = para_start + len(para)
+            para_start = chunk_end + 2  # Skip the '\n\n' separator
 
-        return chunks
+        # Add remaining chunk
+        if has_chunk:
+            yield content[chunk_start:chunk_end]
 
-    def _context_aware_chunking(self, content: str) -> List[str]:
+    def _iter_context_aware_chunks(self, content: str) -> Iterator[str]:
         """Split content with overlap for context preservation
 
         Based on L208 lines 741-772 (Context-Aware Chunking)
@@ -288,22 +435,15 @@ class TaskDecomposer:
         Args:
             content: Content to chunk
 
-        Returns:
-            List of chunks with overlap
+        Yields:
+            Chunks overlapping the previous chunk by `overlap` words
         """
-        words = content.split()
-        chunks = []
-
-        for i in range(0, len(words), self.chunk_size - self.overlap):
-            chunk_words = words[i:i + self.chunk_size]
-            chunk = " ".join(chunk_words)
-            chunks.append(chunk)
+        chunk_size = self.chunk_size
+        stride = chunk_size - self.overlap
+        starts, ends = self._word_spans(content)
 
-            # Stop if we've covered all content
-            if i + self.chunk_size >= len(words):
-                break
-
-        return chunks
+        for start, end in _window_spans(starts, ends, chunk_size, stride):
+            yield content[start:end]
 
 
 class RecursiveTaskProcessor:
@@ -316,7 +456,8 @@ class RecursiveTaskProcessor:
         self,
         decomposer: TaskDecomposer,
         processor_func: Callable,
-        max_depth: int = 3
+        max_depth: int = 3,
+        executor: Optional[Executor] = None
     ):
         """Initialize recursive processor
 
@@ -324,10 +465,13 @@ class RecursiveTaskProcessor:
             decomposer: TaskDecomposer instance
             processor_func: Function to process leaf tasks
             max_depth: Maximum recursion depth
+            executor: Optional executor for processing top-level subtrees
+                      concurrently (useful when processor_func is I/O-bound)
         """
         self.decomposer = decomposer
         self.processor_func = processor_func
         self.max_depth = max_depth
+        self.executor = executor
 
     def process(
         self,
@@ -360,27 +504,93 @@ class RecursiveTaskProcessor:
             return self.processor_func(content)
 
         # Recursive case: decompose and recurse
-        tasks = self.decomposer.decompose(document_id, content)
+        tasks = self.decomposer.iter_decompose(document_id, content)
+        parent_task = next(tasks)
 
-        if len(tasks) == 1:
+        if parent_task.is_leaf:
             # No decomposition occurred, process directly
             return self.processor_func(content)
 
-        # Process child tasks recursively
-        parent_task = tasks[0]
-        child_tasks = tasks[1:]
-
-        child_results = []
-        for child_task in child_tasks:
-            result = self.process(
-                child_task.task_id,
-                child_task.content,
-                depth + 1
-            )
-            child_results.append(result)
+        if self.executor is not None and depth == 0:
+            # Top-level subtrees run concurrently; each subtree recurses
+            # serially inside its worker so no worker blocks on the pool.
+            child_results = list(self.executor.map(
+                lambda child_task: self.process(
+                    child_task.task_id,
+                    child_task.content,
+                    depth + 1
+                ),
+                tasks
+            ))
+        else:
+            # Process child tasks recursively as they are produced
+            child_results = []
+            for child_task in tasks:
+                result = self.process(
+                    child_task.task_id,
+                    child_task.content,
+                    depth + 1
+                )
+                child_results.append(result)
 
         # Aggregate results
         return self.decomposer.aggregate_results(
             parent_task.task_id,
             child_results
         )
+
+    async def process_async(
+        self,
+        document_id: str,
+        content: str,
+        depth: int = 0
+    ) -> Any:
+        """Process document recursively, running sibling subtrees concurrently
+
+        Async counterpart to process(). processor_func may be a plain function
+        or a coroutine function; sibling child tasks are awaited together with
+        asyncio.gather.
+
+        Args:
+            document_id: Document identifier
+            content: Document content
+            depth: Current recursion depth
+
+        Returns:
+            Processed result
+        """
+        # Base case: max depth reached or content small enough
+        if depth >= self.max_depth or len(content.split()) <= self.decomposer.chunk_size:
+            return await self._process_leaf_async(content)
+
+        tasks = self.decomposer.iter_decompose(document_id, content)
+        parent_task = next(tasks)
+
+        if parent_task.is_leaf:
+            # No decomposition occurred, process directly
+            return await self._process_leaf_async(content)
+
+        child_results = await asyncio.gather(*(
+            self.process_async(child_task.task_id, child_task.content, depth + 1)
+            for child_task in tasks
+        ))
+
+        # Aggregate results
+        return self.decomposer.aggregate_results(
+            parent_task.task_id,
+            list(child_results)
+        )
+
+    async def _process_leaf_async(self, content: str) -> Any:
+        """Run processor_func, awaiting it if it returns an awaitable
+
+        Args:
+            content: Leaf content
+
+        Returns:
+            Processed result
+        """
+        result = self.processor_func(content)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
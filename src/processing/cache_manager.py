@@ -9,15 +9,194 @@ Implements caching for LLM responses to:
 Based on L208 lines 92-192 (Idempotence & Reproducibility - LLM Response Caching)
 """
 
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, List, Iterable, Iterator, Union
+import atexit
 import hashlib
+import itertools
 import json
+import math
+import mmap
+import os
+import queue
+import sqlite3
+import threading
 import time
+import weakref
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
 
-@dataclass
+
+# Characters of prompt encoded per hash update in get_cache_key
+_KEY_ENCODE_WINDOW = 64 * 1024
+
+# Least-recently-used entries scored per eviction when max_entries is set
+_EVICTION_SAMPLE = 8
+
+
+def _key(
+    prompt: Union[str, bytes],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    seed: Optional[int]
+) -> str:
+    """Compute cache key digest
+
+    Only the parameter prefix is memoized; the prompt is hashed on every
+    call so the memo never holds (potentially large) prompts alive.
+
+    Args:
+        prompt: LLM prompt (str, or UTF-8 encoded bytes)
+        model: Model name
+        temperature: Temperature parameter
+        max_tokens: Max tokens parameter
+        seed: Random seed (if any)
+
+    Returns:
+        BLAKE2b-256 hex digest of inputs
+    """
+    prefix = _cached_key_prefix(model, temperature, max_tokens, seed)
+    return _finish_key(prefix.copy(), prompt)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _cached_key_prefix(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    seed: Optional[int]
+) -> Any:
+    """Memoized _key_prefix; callers must copy() the result before use
+
+    A run uses a handful of parameter combinations, so the prefix hash is
+    built once per combination. typed=True keeps e.g. temperature 1 and
+    1.0 apart, matching their distinct reprs in the hashed layout.
+    """
+    return _key_prefix(model, temperature, max_tokens, seed)
+
+
+def _key_prefix(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    seed: Optional[int]
+) -> Any:
+    """Start a cache key hash with the non-prompt parameters
+
+    Args:
+        model: Model name
+        temperature: Temperature parameter
+        max_tokens: Max tokens parameter
+        seed: Random seed (if any)
+
+    Returns:
+        BLAKE2b-256 hash object, ready for the prompt
+    """
+    # Feed a canonical byte layout straight to the hash: parameters
+    # first, NUL-separated, then the (potentially large) prompt
+    digest = hashlib.blake2b(model.encode(), digest_size=32)
+    digest.update(f"\x00{temperature!r}|{max_tokens!r}|{seed!r}\x00".encode())
+    return digest
+
+
+def _finish_key(digest: Any, prompt: Union[str, bytes]) -> str:
+    """Feed the prompt into a cache key hash and return the digest
+
+    Args:
+        digest: Hash object from _key_prefix (consumed)
+        prompt: LLM prompt (str, or UTF-8 encoded bytes)
+
+    Returns:
+        BLAKE2b-256 hex digest
+    """
+    if isinstance(prompt, bytes):
+        digest.update(prompt)
+    else:
+        # Encode in windows so a large prompt never needs a second
+        # full-size copy; UTF-8 of the pieces equals UTF-8 of the whole
+        for i in range(0, len(prompt), _KEY_ENCODE_WINDOW):
+            digest.update(prompt[i:i + _KEY_ENCODE_WINDOW].encode())
+
+    return digest.hexdigest()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize object (or dataclass) to JSON bytes
+
+    Uses orjson when installed, which serializes dataclasses natively and
+    is several times faster than the stdlib encoder. Output is compact:
+    cache and checkpoint files are machine-read only.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            # Non-str dict keys are coerced like the stdlib encoder does
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Anything else orjson rejects gets the stdlib's verdict
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _map_file(path: Path) -> Optional[mmap.mmap]:
+    """Memory-map a file read-only
+
+    Parsing straight from the mapping reads the OS page cache without an
+    intermediate Python-level copy of the whole file.
+
+    Args:
+        path: File to map
+
+    Returns:
+        Read-only mapping, or None if the file is empty (cannot be mapped)
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _flush_at_exit(manager_ref: weakref.ref) -> None:
+    """atexit hook: flush a CacheManager if it is still alive
+
+    Args:
+        manager_ref: Weak reference to the manager
+    """
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Cached LLM response"""
     key: str
@@ -42,10 +221,529 @@ class CacheEntry:
         return age > ttl_seconds
 
 
+class BaseCacheStore:
+    """Base class for cache entry storage
+
+    Design Decision: Strategy pattern for different storage backends.
+    CacheManager keeps live entries in memory and delegates persistence
+    to a store, so backends only need bulk load/save/remove operations.
+    """
+
+    def load(self) -> List[CacheEntry]:
+        """Load all persisted entries
+
+        Returns:
+            List of cache entries (expired entries included)
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError("Subclasses must implement load()")
+
+    def save(self, entries: Iterable[CacheEntry]) -> None:
+        """Persist entries, replacing any stored entry with the same key
+
+        Args:
+            entries: Cache entries to save
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError("Subclasses must implement save()")
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Remove persisted entries
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError("Subclasses must implement remove()")
+
+    def clear(self) -> None:
+        """Remove all persisted entries
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError("Subclasses must implement clear()")
+
+    def size_bytes(self) -> int:
+        """Get on-disk size of the store
+
+        Raises:
+            NotImplementedError: Subclasses must implement
+        """
+        raise NotImplementedError("Subclasses must implement size_bytes()")
+
+    def close(self) -> None:
+        """Release resources held by the store (no-op by default)"""
+
+
+class FileCacheStore(BaseCacheStore):
+    """Stores each cache entry as a JSON file named after its key"""
+
+    # Cache file extension; subclasses storing another encoding override it
+    SUFFIX = ".json"
+
+    # Below this many files, thread start-up costs more than it saves
+    PARALLEL_LOAD_THRESHOLD = 64
+
+    def __init__(self, cache_dir: Path):
+        """Initialize file store
+
+        Args:
+            cache_dir: Directory holding cache files
+        """
+        self.cache_dir = cache_dir
+
+    def _scan(self) -> List[os.DirEntry]:
+        """List cache files in a single directory scan
+
+        os.scandir yields DirEntry objects whose stat() results are cached,
+        avoiding the per-file Path allocation and extra stat calls of glob.
+
+        Returns:
+            DirEntry objects for cache files (empty if directory is missing)
+        """
+        suffix = self.SUFFIX
+        try:
+            with os.scandir(self.cache_dir) as it:
+                return [de for de in it if de.name.endswith(suffix) and de.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def load(self) -> List[CacheEntry]:
+        """Load all cache files, skipping corrupted ones
+
+        Returns:
+            List of cache entries
+        """
+        paths = [de.path for de in self._scan()]
+
+        if len(paths) < self.PARALLEL_LOAD_THRESHOLD:
+            loaded = map(self._load_one, paths)
+        else:
+            # File reads release the GIL, so startup on large caches
+            # overlaps I/O across threads
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._load_one, paths))
+
+        return [entry for entry in loaded if entry is not None]
+
+    def _load_one(self, path: str) -> Optional[CacheEntry]:
+        """Load a single cache file
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            Cache entry, or None if the file is corrupted
+        """
+        try:
+            with open(path, 'rb') as f:
+                return CacheEntry(**_loads(self._decode(f.read())))
+        except Exception as e:
+            # Skip corrupted cache files
+            print(f"Warning: Could not load cache file {path}: {e}")
+            return None
+
+    def _encode(self, data: bytes) -> bytes:
+        """Transform serialized entry before writing (identity here)
+
+        Args:
+            data: JSON bytes
+
+        Returns:
+            Bytes to write
+        """
+        return data
+
+    def _decode(self, data: bytes) -> bytes:
+        """Reverse _encode after reading (identity here)
+
+        Args:
+            data: Bytes read from file
+
+        Returns:
+            JSON bytes
+        """
+        return data
+
+    def save(self, entries: Iterable[CacheEntry]) -> None:
+        """Write one file per entry
+
+        Args:
+            entries: Cache entries to save
+        """
+        for entry in entries:
+            cache_file = self.cache_dir / f"{entry.key}{self.SUFFIX}"
+            try:
+                cache_file.write_bytes(self._encode(_dumps(entry)))
+            except Exception as e:
+                print(f"Warning: Could not save cache entry: {e}")
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Delete cache files
+
+        Args:
+            keys: Cache keys to remove
+        """
+        for key in keys:
+            cache_file = self.cache_dir / f"{key}{self.SUFFIX}"
+            if cache_file.exists():
+                try:
+                    cache_file.unlink()
+                except Exception as e:
+                    print(f"Warning: Could not remove cache file: {e}")
+
+    def clear(self) -> None:
+        """Delete all cache files"""
+        for de in self._scan():
+            os.unlink(de.path)
+
+    def size_bytes(self) -> int:
+        """Sum the sizes of all cache files
+
+        Returns:
+            Total size in bytes
+        """
+        return sum(de.stat().st_size for de in self._scan())
+
+
+class CompressedFileCacheStore(FileCacheStore):
+    """Stores each cache entry as a zlib-compressed JSON file
+
+    LLM responses are natural-language text and typically shrink several
+    times over, reducing bytes written/read and reported cache size.
+    """
+
+    SUFFIX = ".json.z"
+
+    # Fast levels keep compression cheap relative to the disk write
+    COMPRESSION_LEVEL = 3
+
+    def _encode(self, data: bytes) -> bytes:
+        """Compress serialized entry
+
+        Args:
+            data: JSON bytes
+
+        Returns:
+            zlib-compressed bytes
+        """
+        return zlib.compress(data, self.COMPRESSION_LEVEL)
+
+    def _decode(self, data: bytes) -> bytes:
+        """Decompress cache file contents
+
+        Args:
+            data: zlib-compressed bytes
+
+        Returns:
+            JSON bytes
+        """
+        return zlib.decompress(data)
+
+
+class SQLiteCacheStore(BaseCacheStore):
+    """Stores all cache entries in a single SQLite database
+
+    One file replaces one-file-per-entry: loading is a single query rather
+    than a directory scan plus an open/read per entry, and bulk writes or
+    deletes share one transaction. The database is opened in WAL mode on
+    first use.
+    """
+
+    DB_FILENAME = "cache.db"
+
+    _COLUMNS = "key, prompt, model, temperature, response, created_at, hit_count, metadata"
+
+    def __init__(self, cache_dir: Path):
+        """Initialize SQLite store
+
+        Args:
+            cache_dir: Directory holding the database file
+        """
+        self.db_path = cache_dir / self.DB_FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use
+
+        Returns:
+            SQLite connection
+        """
+        if self._conn is None:
+            # Calls are serialized, but may come from BackgroundCacheStore's thread
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, prompt TEXT, model TEXT, temperature REAL, "
+                "response TEXT, created_at REAL, hit_count INTEGER, metadata TEXT)"
+            )
+        return self._conn
+
+    def load(self) -> List[CacheEntry]:
+        """Load all entries with one query
+
+        Returns:
+            List of cache entries
+        """
+        try:
+            rows = self._connection().execute(
+                f"SELECT {self._COLUMNS} FROM cache_entries"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not load cache database {self.db_path}: {e}")
+            return []
+
+        return [
+            CacheEntry(
+                key=key,
+                prompt=prompt,
+                model=model,
+                temperature=temperature,
+                response=response,
+                created_at=created_at,
+                hit_count=hit_count,
+                metadata=_loads(metadata) if metadata is not None else None
+            )
+            for key, prompt, model, temperature, response, created_at, hit_count, metadata in rows
+        ]
+
+    def save(self, entries: Iterable[CacheEntry]) -> None:
+        """Upsert entries in a single transaction
+
+        Args:
+            entries: Cache entries to save
+        """
+        rows = [
+            (
+                entry.key, entry.prompt, entry.model, entry.temperature, entry.response,
+                entry.created_at, entry.hit_count,
+                _dumps(entry.metadata).decode() if entry.metadata is not None else None
+            )
+            for entry in entries
+        ]
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO cache_entries ({self._COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save cache entry: {e}")
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Delete entries in a single transaction
+
+        Args:
+            keys: Cache keys to remove
+        """
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    "DELETE FROM cache_entries WHERE key = ?",
+                    [(key,) for key in keys]
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not remove cache entry: {e}")
+
+    def clear(self) -> None:
+        """Delete all entries"""
+        if not self.db_path.exists():
+            return
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def size_bytes(self) -> int:
+        """Get database size from its page count
+
+        Returns:
+            Database size in bytes
+        """
+        if not self.db_path.exists():
+            return 0
+        page_count, page_size = self._connection().execute(
+            "SELECT page_count, page_size FROM pragma_page_count(), pragma_page_size()"
+        ).fetchone()
+        return page_count * page_size
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class BackgroundCacheStore(BaseCacheStore):
+    """Applies writes to a wrapped store on a background thread
+
+    Design Decision: save/remove/clear return as soon as the operation is
+    queued. The writer thread drains everything queued since its last pass
+    and coalesces consecutive saves into one store.save() call (a single
+    transaction for SQLite), so bursts of writes cost one round of I/O.
+    Reads drain the queue first, so they always observe queued writes.
+    close() applies what is queued and stops the thread; later writes are
+    applied synchronously.
+    """
+
+    _STOP = ('stop', None)  # Queued by close(); ends the writer loop
+
+    def __init__(self, store: BaseCacheStore):
+        """Start the writer thread
+
+        Args:
+            store: Store that performs the actual I/O
+        """
+        self.store = store
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="cache-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.drain)
+
+    def load(self) -> List[CacheEntry]:
+        """Load entries after pending writes are applied"""
+        self.drain()
+        return self.store.load()
+
+    def save(self, entries: Iterable[CacheEntry]) -> None:
+        """Queue entries for saving"""
+        self._submit(('save', list(entries)))
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Queue keys for removal"""
+        self._submit(('remove', list(keys)))
+
+    def clear(self) -> None:
+        """Queue removal of all entries"""
+        self._submit(('clear', None))
+
+    def size_bytes(self) -> int:
+        """Get on-disk size after pending writes are applied"""
+        self.drain()
+        return self.store.size_bytes()
+
+    def drain(self) -> None:
+        """Block until every queued operation has been applied"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Apply queued writes, stop the writer thread and close the store
+
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put(self._STOP)
+        self._thread.join()
+        atexit.unregister(self.drain)
+
+        # Writes that raced with close() landed after the sentinel
+        while True:
+            try:
+                op = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._apply_logged([op])
+            self._queue.task_done()
+
+        self.store.close()
+
+    def _submit(self, op: tuple) -> None:
+        """Queue an operation, or apply it now once closed
+
+        Args:
+            op: (operation, argument) pair
+        """
+        if self._closed:
+            self._apply_logged([op])
+        else:
+            self._queue.put(op)
+
+    def _run(self) -> None:
+        """Writer loop: apply queued operations in batches until stopped"""
+        while True:
+            ops = [self._queue.get()]
+            while True:
+                try:
+                    ops.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._apply_logged([op for op in ops if op is not self._STOP])
+            finally:
+                for _ in ops:
+                    self._queue.task_done()
+
+            if any(op is self._STOP for op in ops):
+                return
+
+    def _apply_logged(self, ops: List[tuple]) -> None:
+        """Apply operations, reporting failures as warnings
+
+        Args:
+            ops: (operation, argument) pairs in queue order
+        """
+        try:
+            self._apply(ops)
+        except Exception as e:
+            print(f"Warning: Background cache write failed: {e}")
+
+    def _apply(self, ops: List[tuple]) -> None:
+        """Apply a batch of operations in order, coalescing saves
+
+        Args:
+            ops: (operation, argument) pairs in queue order
+        """
+        pending: Dict[str, CacheEntry] = {}
+        for op, arg in ops:
+            if op == 'save':
+                for entry in arg:
+                    pending[entry.key] = entry
+                continue
+
+            if pending:
+                self.store.save(pending.values())
+                pending = {}
+            if op == 'remove':
+                self.store.remove(arg)
+            else:
+                self.store.clear()
+
+        if pending:
+            self.store.save(pending.values())
+
+
+_CACHE_STORES = {
+    'file': FileCacheStore,
+    'file+zlib': CompressedFileCacheStore,
+    'sqlite': SQLiteCacheStore,
+}
+
+
 class CacheManager:
     """Manages LLM response caching
 
     Design Decision: File-based cache for simplicity and persistence.
+    Set backend="sqlite" to keep all entries in one database file, which
+    avoids per-entry files once the cache grows to thousands of entries,
+    or backend="file+zlib" to compress each entry file.
+    Set max_entries to bound the cache for long-lived workers: entries are
+    kept in LRU order and, among the least recently used few, the one with
+    the lowest retention score (log(hits + 1) - age / ttl) is evicted, so
+    cold-but-popular entries go last.
     For production, consider Redis or database backend for:
     - Better performance (faster lookups)
     - Distributed caching (multiple workers)
@@ -59,7 +757,11 @@ class CacheManager:
         self,
         cache_dir: str = ".aget/cache",
         ttl_seconds: int = 86400,  # 24 hours default
-        enabled: bool = True
+        enabled: bool = True,
+        hit_flush_threshold: int = 64,
+        backend: str = "file",
+        max_entries: Optional[int] = None,
+        background_writes: bool = False
     ):
         """Initialize cache manager
 
@@ -67,19 +769,42 @@ class CacheManager:
             cache_dir: Directory for cache storage
             ttl_seconds: Time-to-live for cache entries (seconds)
             enabled: Whether caching is enabled
+            hit_flush_threshold: Number of entries with unsaved hit counts
+                                 to accumulate before writing them to disk
+            backend: Storage backend ("file", "file+zlib" or "sqlite")
+            max_entries: Maximum number of cached entries (None = unbounded).
+                         Evicted entries are removed from storage as well
+            background_writes: Apply disk writes on a background thread
+                               (see BackgroundCacheStore)
         """
+        if backend not in _CACHE_STORES:
+            raise ValueError(f"Unsupported cache backend: {backend}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
         self.cache_dir = Path(cache_dir)
+        self.backend = backend
+        self._store: BaseCacheStore = _CACHE_STORES[backend](self.cache_dir)
+        if background_writes and enabled:
+            self._store = BackgroundCacheStore(self._store)
         self.ttl_seconds = ttl_seconds
         self.enabled = enabled
-        self._cache: Dict[str, CacheEntry] = {}
+        self.hit_flush_threshold = hit_flush_threshold
+        self.max_entries = max_entries
+        self._cache: Dict[str, CacheEntry] = OrderedDict()  # LRU order, oldest first
+        self._dirty_keys: set = set()  # Entries whose hit_count is not yet on disk
 
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             self._load_cache()
+            # Weakly referenced so the hook does not keep the manager (and
+            # its in-memory cache) alive; close() unregisters it
+            self._atexit_hook = partial(_flush_at_exit, weakref.ref(self))
+            atexit.register(self._atexit_hook)
 
     def get_cache_key(
         self,
-        prompt: str,
+        prompt: Union[str, bytes],
         model: str,
         temperature: float = 0.0,
         max_tokens: int = 1000,
@@ -90,29 +815,45 @@ class CacheManager:
         Based on L208 lines 117-127 (Cache key generation)
 
         Args:
-            prompt: LLM prompt
+            prompt: LLM prompt (str, or UTF-8 encoded bytes)
             model: Model name
             temperature: Temperature parameter
             max_tokens: Max tokens parameter
             seed: Random seed (if any)
 
         Returns:
-            SHA-256 hash of inputs
-        """
-        # Create deterministic representation
-        cache_input = {
-            'prompt': prompt,
-            'model': model,
-            'temperature': temperature,
-            'max_tokens': max_tokens,
-            'seed': seed
-        }
+            BLAKE2b-256 hex digest of inputs
+        """
+        return _key(prompt, model, temperature, max_tokens, seed)
+
+    def specialize(
+        self,
+        model: str,
+        temperature: float = 0.0,
+        max_tokens: int = 1000,
+        seed: Optional[int] = None
+    ) -> Callable[[Union[str, bytes]], str]:
+        """Build a cache key function for fixed model parameters
+
+        Pipelines usually run one model configuration, so the parameter
+        portion of the hash is computed once here; each call only copies
+        that hash state and feeds the prompt. Keys equal get_cache_key().
 
-        # Serialize to JSON (sorted keys for determinism)
-        key_str = json.dumps(cache_input, sort_keys=True)
+        Args:
+            model: Model name
+            temperature: Temperature parameter
+            max_tokens: Max tokens parameter
+            seed: Random seed (if any)
 
-        # Generate hash
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        Returns:
+            Function mapping a prompt to its cache key
+        """
+        prefix = _key_prefix(model, temperature, max_tokens, seed)
+
+        def fast_key(prompt: Union[str, bytes]) -> str:
+            return _finish_key(prefix.copy(), prompt)
+
+        return fast_key
 
     def get(
         self,
@@ -148,12 +889,16 @@ class CacheManager:
         if entry.is_expired(self.ttl_seconds):
             # Remove expired entry
             del self._cache[key]
-            self._remove_cache_file(key)
+            self._dirty_keys.discard(key)
+            self._remove_entry(key)
             return None
 
-        # Update hit count
+        # Update hit count in memory; persisted in batches by flush()
         entry.hit_count += 1
-        self._save_entry(entry)
+        self._cache.move_to_end(key)
+        self._dirty_keys.add(key)
+        if len(self._dirty_keys) >= self.hit_flush_threshold:
+            self.flush()
 
         return entry.response
 
@@ -198,10 +943,45 @@ class CacheManager:
         )
 
         self._cache[key] = entry
+        self._cache.move_to_end(key)
+        self._dirty_keys.discard(key)
         self._save_entry(entry)
+        self._evict()
 
         return key
 
+    def flush(self) -> int:
+        """Write pending hit-count updates to disk
+
+        Called automatically once hit_flush_threshold entries are pending,
+        on clear_expired(), and at interpreter exit.
+
+        Returns:
+            Number of entries written
+        """
+        dirty_keys = self._dirty_keys
+        self._dirty_keys = set()
+
+        # Cache directory may have been removed (e.g. temporary caches)
+        if not dirty_keys or not self.cache_dir.exists():
+            return 0
+
+        entries = [self._cache[key] for key in dirty_keys if key in self._cache]
+        self._store.save(entries)
+
+        return len(entries)
+
+    def close(self) -> None:
+        """Flush pending hit counts and release the storage backend
+
+        Stops the writer thread of background_writes. Safe to call more
+        than once.
+        """
+        if self.enabled:
+            self.flush()
+            atexit.unregister(self._atexit_hook)
+        self._store.close()
+
     def clear(self) -> int:
         """Clear all cache entries
 
@@ -210,11 +990,10 @@ class CacheManager:
         """
         count = len(self._cache)
         self._cache.clear()
+        self._dirty_keys.clear()
 
-        # Remove all cache files
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+        # Remove all persisted entries
+        self._store.clear()
 
         return count
 
@@ -231,7 +1010,12 @@ class CacheManager:
 
         for key in expired_keys:
             del self._cache[key]
-            self._remove_cache_file(key)
+            self._dirty_keys.discard(key)
+
+        if expired_keys:
+            self._store.remove(expired_keys)
+
+        self.flush()
 
         return len(expired_keys)
 
@@ -247,10 +1031,7 @@ class CacheManager:
         total_entries = len(self._cache)
 
         # Calculate cache size
-        total_size = 0
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                total_size += cache_file.stat().st_size
+        total_size = self._store.size_bytes()
 
         return {
             'total_entries': total_entries,
@@ -265,20 +1046,48 @@ class CacheManager:
         if not self.cache_dir.exists():
             return
 
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
+        for entry in self._store.load():
+            # Skip expired entries
+            if not entry.is_expired(self.ttl_seconds):
+                self._cache[entry.key] = entry
+
+        self._evict()
 
-                entry = CacheEntry(**data)
+    def _evict(self) -> None:
+        """Evict entries until the cache fits within max_entries"""
+        if self.max_entries is None or len(self._cache) <= self.max_entries:
+            return
 
-                # Skip expired entries
-                if not entry.is_expired(self.ttl_seconds):
-                    self._cache[entry.key] = entry
+        now = time.time()
+        evicted_keys = []
+        while len(self._cache) > self.max_entries:
+            # Never sample the most recently used entry: set() has just put
+            # it there with no hits, so it would otherwise score lowest and
+            # be evicted on insert whenever max_entries < _EVICTION_SAMPLE
+            sample = min(_EVICTION_SAMPLE, len(self._cache) - 1)
+            candidates = itertools.islice(self._cache.values(), sample)
+            victim = min(candidates, key=lambda e: self._retention_score(e, now))
+            del self._cache[victim.key]
+            self._dirty_keys.discard(victim.key)
+            evicted_keys.append(victim.key)
 
-            except Exception as e:
-                # Skip corrupted cache files
-                print(f"Warning: Could not load cache file {cache_file}: {e}")
+        self._store.remove(evicted_keys)
+
+    def _retention_score(self, entry: CacheEntry, now: float) -> float:
+        """Score how much an entry is worth keeping (higher = keep longer)
+
+        Args:
+            entry: Cache entry
+            now: Current timestamp
+
+        Returns:
+            log(hit_count + 1) minus age as a fraction of the TTL; -inf for
+            every entry when ttl_seconds <= 0 (all equally stale, so the
+            LRU-first sample order decides)
+        """
+        if self.ttl_seconds <= 0:
+            return -math.inf
+        return math.log(entry.hit_count + 1) - (now - entry.created_at) / self.ttl_seconds
 
     def _save_entry(self, entry: CacheEntry) -> None:
         """Save cache entry to disk
@@ -286,26 +1095,79 @@ class CacheManager:
         Args:
             entry: Cache entry to save
         """
-        cache_file = self.cache_dir / f"{entry.key}.json"
-
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(asdict(entry), f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save cache entry: {e}")
+        self._store.save([entry])
 
-    def _remove_cache_file(self, key: str) -> None:
-        """Remove cache file from disk
+    def _remove_entry(self, key: str) -> None:
+        """Remove persisted cache entry
 
         Args:
             key: Cache key
         """
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            try:
-                cache_file.unlink()
-            except Exception as e:
-                print(f"Warning: Could not remove cache file: {e}")
+        self._store.remove([key])
+
+
+class _BloomFilter:
+    """Fixed-capacity Bloom filter over strings
+
+    Bits live in a bytearray; k positions per item come from double hashing
+    one BLAKE2b digest. Supports the subset of set operations
+    CheckpointManager uses (add, update, in, len, clear).
+    """
+
+    __slots__ = ('num_bits', 'num_hashes', 'bits', '_count')
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Size the filter for a capacity and false-positive rate
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive probability at capacity
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Bloom filter needs capacity >= 1 and 0 < error_rate < 1")
+
+        ln2 = math.log(2)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (ln2 * ln2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * ln2))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Yield the bit positions for an item"""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        """Set the bits for an item"""
+        bits = self.bits
+        new = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self._count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add several items"""
+        for item in items:
+            self.add(item)
+
+    def clear(self) -> None:
+        """Reset all bits"""
+        self.bits = bytearray(len(self.bits))
+        self._count = 0
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self._count
 
 
 class CheckpointManager:
@@ -314,17 +1176,48 @@ class CheckpointManager:
     Tracks which documents have been processed to enable resumption
     after crashes or interruptions.
 
+    Design Decision: Completions are appended to a log next to the
+    checkpoint file (one JSON string per line), so marking a document is
+    O(1) I/O instead of rewriting the whole set. The log is folded into
+    the JSON snapshot once it holds more than twice as many entries as the
+    snapshot: on startup, and while running once it also reaches
+    COMPACT_MIN_LOG_LINES (so rewrites stay amortized O(1) per mark).
+
+    For corpora of millions of documents, pass bloom_capacity to track
+    completions in a Bloom filter (~1.8 bytes per document at 0.1% error)
+    instead of a set. Membership then becomes approximate: is_complete may
+    return True for an unprocessed document with probability
+    bloom_error_rate, which skips it. The log stays the exact record and is
+    not compacted in this mode.
+
     Based on L208 lines 152-192 (Crash Recovery implementation)
     """
 
-    def __init__(self, checkpoint_file: str = ".aget/checkpoints/processing.json"):
+    # Smallest log that is compacted while running (startup compacts any
+    # log that outgrows the snapshot)
+    COMPACT_MIN_LOG_LINES = 1000
+
+    def __init__(
+        self,
+        checkpoint_file: str = ".aget/checkpoints/processing.json",
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = 0.001
+    ):
         """Initialize checkpoint manager
 
         Args:
             checkpoint_file: Path to checkpoint state file
+            bloom_capacity: Expected document count; if set, track completions
+                            in a Bloom filter sized for it (None = exact set)
+            bloom_error_rate: Bloom filter false-positive rate at capacity
         """
         self.checkpoint_file = Path(checkpoint_file)
-        self.completed: set = set()
+        self.log_file = self.checkpoint_file.with_suffix('.log')
+        self.exact = bloom_capacity is None
+        self.completed = set() if self.exact else _BloomFilter(bloom_capacity, bloom_error_rate)
+        self._log = None  # Append handle, opened on first mark_complete
+        self._snapshot_entries = 0  # IDs in the snapshot file
+        self._log_lines = 0  # Entries in the log file
         self._load_checkpoint()
 
     def is_complete(self, document_id: str) -> bool:
@@ -344,42 +1237,157 @@ class CheckpointManager:
         Args:
             document_id: Document identifier
         """
+        # A Bloom filter hit may be a false positive, so in that mode the
+        # ID is always logged: the log is the exact record. Repeats only
+        # cost a duplicate line.
+        if self.exact and document_id in self.completed:
+            return
+
         self.completed.add(document_id)
-        self._save_checkpoint()
+        self._append_log(document_id)
+
+        if (self.exact
+                and self._log_lines >= self.COMPACT_MIN_LOG_LINES
+                and self._log_lines > 2 * self._snapshot_entries):
+            self._compact()
 
     def get_completed_count(self) -> int:
         """Get number of completed documents
 
         Returns:
-            Count of completed documents
+            Count of completed documents (approximate in Bloom filter mode)
         """
         return len(self.completed)
 
     def clear(self) -> None:
         """Clear all checkpoints"""
         self.completed.clear()
+        self._close_log()
+        self._snapshot_entries = 0
+        self._log_lines = 0
         if self.checkpoint_file.exists():
             self.checkpoint_file.unlink()
+        if self.log_file.exists():
+            self.log_file.unlink()
 
     def _load_checkpoint(self) -> None:
-        """Load checkpoint from disk"""
-        if not self.checkpoint_file.exists():
+        """Load checkpoint snapshot and replay the completion log"""
+        if self.checkpoint_file.exists():
+            try:
+                snapshot = self._load_snapshot()
+                self.completed.update(snapshot)
+                self._snapshot_entries = len(snapshot)
+            except Exception as e:
+                print(f"Warning: Could not load checkpoint: {e}")
+                self.completed.clear()
+
+        if not self.log_file.exists():
             return
 
+        log_entries = 0
         try:
-            with open(self.checkpoint_file, 'r') as f:
-                data = json.load(f)
-                self.completed = set(data)
+            mm = _map_file(self.log_file)
+            if mm is not None:
+                with mm:
+                    # Lines are read one at a time from the mapping
+                    for line in iter(mm.readline, b''):
+                        try:
+                            self.completed.add(_loads(line))
+                            log_entries += 1
+                        except Exception:
+                            # Torn final line from an interrupted write
+                            continue
         except Exception as e:
-            print(f"Warning: Could not load checkpoint: {e}")
-            self.completed = set()
+            print(f"Warning: Could not load checkpoint log: {e}")
+            return
 
-    def _save_checkpoint(self) -> None:
-        """Save checkpoint to disk"""
+        self._log_lines = log_entries
+
+        # Compared with the snapshot, not the set: every logged ID is new
+        # to the set, so the log can never outgrow it. A Bloom filter
+        # cannot be enumerated back into a snapshot.
+        if self.exact and log_entries > 2 * self._snapshot_entries:
+            self._compact()
+
+    def _load_snapshot(self) -> List[str]:
+        """Parse the JSON snapshot from a memory map
+
+        Returns:
+            Completed document IDs
+        """
+        mm = _map_file(self.checkpoint_file)
+        if mm is None:
+            raise ValueError("empty checkpoint file")
+
+        with mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return _loads(mm[:])
+
+    def _append_log(self, document_id: str) -> None:
+        """Append one completion to the log
+
+        Args:
+            document_id: Document identifier
+        """
+        try:
+            if self._log is None:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._log = open(self.log_file, 'ab')
+                if self._log.tell() and not self._log_ends_with_newline():
+                    # Terminate a torn line so the next entry starts cleanly
+                    self._log.write(b'\n')
+            self._log.write(json.dumps(document_id).encode() + b'\n')
+            self._log.flush()
+            self._log_lines += 1
+        except Exception as e:
+            print(f"Warning: Could not save checkpoint: {e}")
+
+    def _log_ends_with_newline(self) -> bool:
+        """Check whether the last write to the log completed
+
+        Returns:
+            True if the log ends with a newline
+        """
+        with open(self.log_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _close_log(self) -> None:
+        """Close the append handle if open"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _compact(self) -> None:
+        """Fold the log into the snapshot and truncate it"""
+        if not self._save_checkpoint():
+            return  # Keep the log: it is still the only record
+        self._close_log()
+        try:
+            self.log_file.unlink()
+        except Exception as e:
+            print(f"Warning: Could not compact checkpoint log: {e}")
+            return
+        self._snapshot_entries = len(self.completed)
+        self._log_lines = 0
+
+    def _save_checkpoint(self) -> bool:
+        """Save checkpoint snapshot to disk
+
+        Returns:
+            True if the snapshot was written
+        """
         self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Written aside and renamed into place: compaction deletes the log
+        # afterwards, so a torn snapshot would lose completions
+        tmp_file = self.checkpoint_file.with_suffix('.tmp')
         try:
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(list(self.completed), f, indent=2)
+            tmp_file.write_bytes(_dumps(list(self.completed)))
+            os.replace(tmp_file, self.checkpoint_file)
         except Exception as e:
             print(f"Warning: Could not save checkpoint: {e}")
+            return False
+        return True
@@ -8,10 +8,12 @@ Multi-provider LLM support with unified interface for:
 Based on L208 lines 27-32 (LLM-Powered Processing Pipeline)
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from abc import ABC, abstractmethod
+import asyncio
+import time
 
 
 class LLMProvider(Enum):
@@ -21,7 +23,7 @@ class LLMProvider(Enum):
     GOOGLE = "google"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMRequest:
     """Request to LLM provider"""
     prompt: str
@@ -32,7 +34,7 @@ class LLMRequest:
     additional_params: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM provider"""
     content: str
@@ -51,6 +53,8 @@ class BaseLLMProvider(ABC):
     Subclasses implement provider-specific API calls.
     """
 
+    provider_type: Optional[LLMProvider] = None  # Set by each concrete provider
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize LLM provider
 
@@ -60,6 +64,7 @@ class BaseLLMProvider(ABC):
         """
         self.api_key = api_key
         self.config = kwargs
+        self._cost_rates: Dict[str, Tuple[float, float]] = {}  # model -> per-token (input, output)
 
     @abstractmethod
     def call(self, request: LLMRequest) -> LLMResponse:
@@ -76,6 +81,71 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def acall(self, request: LLMRequest) -> LLMResponse:
+        """Call LLM provider without blocking the event loop
+
+        Default implementation runs call() in a worker thread. Providers
+        with an async SDK client (e.g. openai.AsyncOpenAI) should override.
+
+        Args:
+            request: LLM request parameters
+
+        Returns:
+            LLM response
+        """
+        return await asyncio.to_thread(self.call, request)
+
+    async def abatch(
+        self,
+        requests: List[LLMRequest],
+        concurrency: int = 16,
+        cache: Optional[Any] = None
+    ) -> List[LLMResponse]:
+        """Call LLM provider for many requests concurrently
+
+        Requests are issued through acall() with at most `concurrency` in
+        flight. When a CacheManager is given, cached responses are returned
+        without a network call and fresh responses are stored.
+
+        Args:
+            requests: LLM requests to issue
+            concurrency: Maximum concurrent calls
+            cache: Optional CacheManager consulted before each call
+
+        Returns:
+            Responses in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(request: LLMRequest) -> LLMResponse:
+            if cache is not None:
+                cached = cache.get(
+                    request.prompt, request.model,
+                    request.temperature, request.max_tokens, request.seed
+                )
+                if cached is not None:
+                    return LLMResponse(
+                        content=cached,
+                        model=request.model,
+                        provider=self.provider_type,
+                        usage={'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+                        cost_usd=0.0,
+                        latency_ms=0.0,
+                        cached=True
+                    )
+
+            async with semaphore:
+                response = await self.acall(request)
+
+            if cache is not None:
+                cache.set(
+                    request.prompt, request.model, response.content,
+                    request.temperature, request.max_tokens, request.seed
+                )
+            return response
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
     @abstractmethod
     def get_pricing(self, model: str) -> Dict[str, float]:
         """Get pricing for model
@@ -88,6 +158,21 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Estimate token count without tokenizing
+
+        Uses the ~4 characters per token rule of thumb, which avoids
+        allocating a word list for every request.
+
+        Args:
+            text: Text to estimate
+
+        Returns:
+            Estimated token count (at least 1)
+        """
+        return max(1, len(text) >> 2)
+
     def calculate_cost(
         self,
         model: str,
@@ -104,10 +189,14 @@ class BaseLLMProvider(ABC):
         Returns:
             Cost in USD
         """
-        pricing = self.get_pricing(model)
-        input_cost = (prompt_tokens / 1000) * pricing['input_per_1k']
-        output_cost = (completion_tokens / 1000) * pricing['output_per_1k']
-        return input_cost + output_cost
+        # Per-token rates are resolved once per model, then reused
+        rates = self._cost_rates.get(model)
+        if rates is None:
+            pricing = self.get_pricing(model)
+            rates = (pricing['input_per_1k'] / 1000, pricing['output_per_1k'] / 1000)
+            self._cost_rates[model] = rates
+
+        return prompt_tokens * rates[0] + completion_tokens * rates[1]
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -119,6 +208,16 @@ class OpenAIProvider(BaseLLMProvider):
     should be added when deploying to production.
     """
 
+    provider_type = LLMProvider.OPENAI
+
+    # Pricing per 1K tokens (current as of Oct 2024)
+    PRICING_TABLE = {
+        'gpt-4o': {'input_per_1k': 0.0025, 'output_per_1k': 0.0100},
+        'gpt-4o-mini': {'input_per_1k': 0.00015, 'output_per_1k': 0.00060},
+        'gpt-4-turbo': {'input_per_1k': 0.0100, 'output_per_1k': 0.0300},
+    }
+    DEFAULT_PRICING = {'input_per_1k': 0.001, 'output_per_1k': 0.002}
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize OpenAI provider
 
@@ -136,26 +235,24 @@ class OpenAIProvider(BaseLLMProvider):
             import openai
             response = openai.ChatCompletion.create(...)
         """
-        import time
-
         # STUB: Simulate API call
-        start = time.time()
+        start = time.perf_counter_ns()
 
         # TODO: Replace with actual OpenAI API call
         # For now, return simulated response
         simulated_response = f"[OpenAI {request.model} response to: {request.prompt[:50]}...]"
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
 
         # Simulated usage
-        prompt_tokens = len(request.prompt.split())
-        completion_tokens = len(simulated_response.split())
+        prompt_tokens = self.estimate_tokens(request.prompt)
+        completion_tokens = self.estimate_tokens(simulated_response)
         total_tokens = prompt_tokens + completion_tokens
 
         return LLMResponse(
             content=simulated_response,
             model=request.model,
-            provider=LLMProvider.OPENAI,
+            provider=self.provider_type,
             usage={
                 'prompt_tokens': prompt_tokens,
                 'completion_tokens': completion_tokens,
@@ -167,12 +264,7 @@ class OpenAIProvider(BaseLLMProvider):
 
     def get_pricing(self, model: str) -> Dict[str, float]:
         """Get OpenAI pricing (current as of Oct 2024)"""
-        pricing_table = {
-            'gpt-4o': {'input_per_1k': 0.0025, 'output_per_1k': 0.0100},
-            'gpt-4o-mini': {'input_per_1k': 0.00015, 'output_per_1k': 0.00060},
-            'gpt-4-turbo': {'input_per_1k': 0.0100, 'output_per_1k': 0.0300},
-        }
-        return pricing_table.get(model, {'input_per_1k': 0.001, 'output_per_1k': 0.002})
+        return dict(self.PRICING_TABLE.get(model, self.DEFAULT_PRICING))
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -184,6 +276,16 @@ class AnthropicProvider(BaseLLMProvider):
     should be added when deploying to production.
     """
 
+    provider_type = LLMProvider.ANTHROPIC
+
+    # Pricing per 1K tokens (current as of Oct 2024)
+    PRICING_TABLE = {
+        'claude-3-5-sonnet-20241022': {'input_per_1k': 0.003, 'output_per_1k': 0.015},
+        'claude-3-opus-20240229': {'input_per_1k': 0.015, 'output_per_1k': 0.075},
+        'claude-3-haiku-20240307': {'input_per_1k': 0.00025, 'output_per_1k': 0.00125},
+    }
+    DEFAULT_PRICING = {'input_per_1k': 0.003, 'output_per_1k': 0.015}
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize Anthropic provider
 
@@ -201,25 +303,23 @@ class AnthropicProvider(BaseLLMProvider):
             import anthropic
             response = anthropic.messages.create(...)
         """
-        import time
-
         # STUB: Simulate API call
-        start = time.time()
+        start = time.perf_counter_ns()
 
         # TODO: Replace with actual Anthropic API call
         simulated_response = f"[Anthropic {request.model} response to: {request.prompt[:50]}...]"
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
 
         # Simulated usage
-        prompt_tokens = len(request.prompt.split())
-        completion_tokens = len(simulated_response.split())
+        prompt_tokens = self.estimate_tokens(request.prompt)
+        completion_tokens = self.estimate_tokens(simulated_response)
         total_tokens = prompt_tokens + completion_tokens
 
         return LLMResponse(
             content=simulated_response,
             model=request.model,
-            provider=LLMProvider.ANTHROPIC,
+            provider=self.provider_type,
             usage={
                 'prompt_tokens': prompt_tokens,
                 'completion_tokens': completion_tokens,
@@ -231,12 +331,7 @@ class AnthropicProvider(BaseLLMProvider):
 
     def get_pricing(self, model: str) -> Dict[str, float]:
         """Get Anthropic pricing (current as of Oct 2024)"""
-        pricing_table = {
-            'claude-3-5-sonnet-20241022': {'input_per_1k': 0.003, 'output_per_1k': 0.015},
-            'claude-3-opus-20240229': {'input_per_1k': 0.015, 'output_per_1k': 0.075},
-            'claude-3-haiku-20240307': {'input_per_1k': 0.00025, 'output_per_1k': 0.00125},
-        }
-        return pricing_table.get(model, {'input_per_1k': 0.003, 'output_per_1k': 0.015})
+        return dict(self.PRICING_TABLE.get(model, self.DEFAULT_PRICING))
 
 
 class GoogleProvider(BaseLLMProvider):
@@ -248,6 +343,16 @@ class GoogleProvider(BaseLLMProvider):
     should be added when deploying to production.
     """
 
+    provider_type = LLMProvider.GOOGLE
+
+    # Pricing per 1K tokens (current as of Oct 2024)
+    PRICING_TABLE = {
+        'gemini-2.5-pro': {'input_per_1k': 0.015, 'output_per_1k': 0.060},
+        'gemini-2.5-flash': {'input_per_1k': 0.0003, 'output_per_1k': 0.0012},
+        'gemini-1.5-pro': {'input_per_1k': 0.0035, 'output_per_1k': 0.0105},
+    }
+    DEFAULT_PRICING = {'input_per_1k': 0.003, 'output_per_1k': 0.012}
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize Google provider
 
@@ -265,25 +370,23 @@ class GoogleProvider(BaseLLMProvider):
             import google.generativeai as genai
             response = model.generate_content(...)
         """
-        import time
-
         # STUB: Simulate API call
-        start = time.time()
+        start = time.perf_counter_ns()
 
         # TODO: Replace with actual Google Gemini API call
         simulated_response = f"[Google {request.model} response to: {request.prompt[:50]}...]"
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
 
         # Simulated usage
-        prompt_tokens = len(request.prompt.split())
-        completion_tokens = len(simulated_response.split())
+        prompt_tokens = self.estimate_tokens(request.prompt)
+        completion_tokens = self.estimate_tokens(simulated_response)
         total_tokens = prompt_tokens + completion_tokens
 
         return LLMResponse(
             content=simulated_response,
             model=request.model,
-            provider=LLMProvider.GOOGLE,
+            provider=self.provider_type,
             usage={
                 'prompt_tokens': prompt_tokens,
                 'completion_tokens': completion_tokens,
@@ -295,12 +398,7 @@ class GoogleProvider(BaseLLMProvider):
 
     def get_pricing(self, model: str) -> Dict[str, float]:
         """Get Google Gemini pricing (current as of Oct 2024)"""
-        pricing_table = {
-            'gemini-2.5-pro': {'input_per_1k': 0.015, 'output_per_1k': 0.060},
-            'gemini-2.5-flash': {'input_per_1k': 0.0003, 'output_per_1k': 0.0012},
-            'gemini-1.5-pro': {'input_per_1k': 0.0035, 'output_per_1k': 0.0105},
-        }
-        return pricing_table.get(model, {'input_per_1k': 0.003, 'output_per_1k': 0.012})
+        return dict(self.PRICING_TABLE.get(model, self.DEFAULT_PRICING))
 
 
 class LLMProviderFactory:
@@ -8,10 +8,16 @@ Routes documents to optimal LLM models based on:
 Based on L208 lines 34-90 (Model Routing Strategies)
 """
 
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple, Any, Awaitable
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+import asyncio
+import hashlib
+import sys
+import threading
 
 
 class RoutingStrategy(Enum):
@@ -28,7 +34,26 @@ class ComplexityLevel(Enum):
     HIGH = "high"
 
 
-@dataclass
+# Default (model, cost_per_1k, latency_sec) per complexity level
+# (based on L208 lines 56-76), shared by static and dynamic routing
+_COMPLEXITY_ROUTING = MappingProxyType({
+    ComplexityLevel.LOW: ('gpt-4o-mini', 0.15, 1.0),
+    ComplexityLevel.MEDIUM: ('gemini-2.5-flash', 0.30, 2.0),
+    ComplexityLevel.HIGH: ('gemini-2.5-pro', 15.00, 5.0),
+})
+
+# Metadata complexity labels (lowercase); anything else means MEDIUM
+_COMPLEXITY_LABELS = MappingProxyType({
+    'low': ComplexityLevel.LOW,
+    'simple': ComplexityLevel.LOW,
+    'easy': ComplexityLevel.LOW,
+    'high': ComplexityLevel.HIGH,
+    'complex': ComplexityLevel.HIGH,
+    'difficult': ComplexityLevel.HIGH,
+})
+
+
+@dataclass(slots=True)
 class RoutingDecision:
     """Result of model routing decision"""
     model: str
@@ -61,6 +86,42 @@ class BaseRouter(ABC):
         """
         pass
 
+    def route_batch(self, documents: List[str], metadatas: List[Dict]) -> List[RoutingDecision]:
+        """Determine models for a batch of documents
+
+        Default implementation routes each document in turn; strategies
+        override it when work can be shared across the batch.
+
+        Args:
+            documents: Document contents
+            metadatas: Metadata for each document (same length as documents)
+
+        Returns:
+            RoutingDecision per document, in input order
+        """
+        route = self.route
+        return [route(document, metadata) for document, metadata in zip(documents, metadatas)]
+
+    def route_into(self, document: str, metadata: Dict, out: RoutingDecision) -> RoutingDecision:
+        """Determine which model to use, writing the decision into out
+
+        Lets high-throughput callers reuse one RoutingDecision instead of
+        allocating a new one per document. Default implementation copies
+        the fields of route(); strategies override it to fill out directly.
+
+        Args:
+            document: Document content or reference
+            metadata: Document metadata (size, type, etc.)
+            out: Decision object to overwrite
+
+        Returns:
+            out, updated in place
+        """
+        decision = self.route(document, metadata)
+        for name in RoutingDecision.__slots__:
+            setattr(out, name, getattr(decision, name))
+        return out
+
 
 class StaticRouter(BaseRouter):
     """Static routing based on document characteristics
@@ -92,27 +153,44 @@ class StaticRouter(BaseRouter):
         self.default_model = default_model
         self.default_provider = default_provider
         self.routing_rules = routing_rules or self._default_rules()
+        self._routes = self._build_routes()
 
     def _default_rules(self) -> Dict:
         """Default routing rules (based on L208 lines 56-76)"""
         return {
-            'complexity_low': {
-                'model': 'gpt-4o-mini',
-                'cost_per_1k': 0.15,
-                'latency_sec': 1.0
-            },
-            'complexity_medium': {
-                'model': 'gemini-2.5-flash',
-                'cost_per_1k': 0.30,
-                'latency_sec': 2.0
-            },
-            'complexity_high': {
-                'model': 'gemini-2.5-pro',
-                'cost_per_1k': 15.00,
-                'latency_sec': 5.0
+            f'complexity_{level.value}': {
+                'model': model,
+                'cost_per_1k': cost,
+                'latency_sec': latency
             }
+            for level, (model, cost, latency) in _COMPLEXITY_ROUTING.items()
         }
 
+    def _build_routes(self) -> Dict[ComplexityLevel, Tuple[str, str, float, float]]:
+        """Resolve routing rules per complexity level once
+
+        Levels without a rule fall back to the medium rule, as in route().
+        Call again after modifying routing_rules.
+
+        Returns:
+            Dictionary mapping ComplexityLevel to
+            (model, reasoning, cost_per_1k, latency_sec)
+        """
+        fallback = self.routing_rules.get('complexity_medium')
+        routes = {}
+        for level in ComplexityLevel:
+            rule = self.routing_rules.get(f'complexity_{level.value}', fallback)
+            if rule is None:
+                continue
+            model = sys.intern(rule['model'])
+            routes[level] = (
+                model,
+                f"Static routing: {level.value} complexity → {model}",  # Renamed from rationale
+                rule['cost_per_1k'],
+                rule['latency_sec']
+            )
+        return routes
+
     def route(self, document: str, metadata: Dict) -> RoutingDecision:
         """Route based on static rules
 
@@ -126,21 +204,39 @@ class StaticRouter(BaseRouter):
         # Determine complexity
         complexity = self._assess_complexity(document, metadata)
 
-        # Get routing rule for complexity
-        rule_key = f'complexity_{complexity.value}'
-        rule = self.routing_rules.get(rule_key, self.routing_rules['complexity_medium'])
+        # Get precomputed route for complexity
+        model, reasoning, cost, latency = self._routes[complexity]
 
         return RoutingDecision(
-            model=rule['model'],
+            model=model,
             provider=self.default_provider,  # Use default provider
             strategy=RoutingStrategy.STATIC,
             complexity=complexity,
             confidence=1.0,
-            reasoning=f"Static routing: {complexity.value} complexity → {rule['model']}",  # Renamed from rationale
-            estimated_cost=rule['cost_per_1k'],
-            estimated_latency=rule['latency_sec']
+            reasoning=reasoning,
+            estimated_cost=cost,
+            estimated_latency=latency
         )
 
+    def route_into(self, document: str, metadata: Dict, out: RoutingDecision) -> RoutingDecision:
+        """Route based on static rules, writing the decision into out
+
+        Args:
+            document: Document content
+            metadata: Document metadata (must include 'complexity' or 'word_count')
+            out: Decision object to overwrite
+
+        Returns:
+            out, updated in place
+        """
+        complexity = self._assess_complexity(document, metadata)
+        out.model, out.reasoning, out.estimated_cost, out.estimated_latency = self._routes[complexity]
+        out.provider = self.default_provider
+        out.strategy = RoutingStrategy.STATIC
+        out.complexity = complexity
+        out.confidence = 1.0
+        return out
+
     def _assess_complexity(self, document: str, metadata: Dict) -> ComplexityLevel:
         """Assess document complexity
 
@@ -153,13 +249,7 @@ class StaticRouter(BaseRouter):
         """
         # Use metadata if available
         if 'complexity' in metadata:
-            complexity_str = metadata['complexity'].lower()
-            if complexity_str in ['low', 'simple', 'easy']:
-                return ComplexityLevel.LOW
-            elif complexity_str in ['high', 'complex', 'difficult']:
-                return ComplexityLevel.HIGH
-            else:
-                return ComplexityLevel.MEDIUM
+            return _COMPLEXITY_LABELS.get(metadata['complexity'].lower(), ComplexityLevel.MEDIUM)
 
         # Fall back to word count heuristic
         word_count = metadata.get('word_count', len(document.split()))
@@ -190,6 +280,12 @@ class DynamicRouter(BaseRouter):
         """
         self.classifier = classifier or self._default_classifier
 
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear memoized default-classifier results"""
+        with _CLASSIFY_MEMO_LOCK:
+            _CLASSIFY_MEMO.clear()
+
     def route(self, document: str, metadata: Dict) -> RoutingDecision:
         """Route based on content analysis
 
@@ -207,17 +303,11 @@ class DynamicRouter(BaseRouter):
         confidence = analysis['confidence']
 
         # Route based on complexity
-        model_map = {
-            ComplexityLevel.LOW: ('gpt-4o-mini', 0.15, 1.0),
-            ComplexityLevel.MEDIUM: ('gemini-2.5-flash', 0.30, 2.0),
-            ComplexityLevel.HIGH: ('gemini-2.5-pro', 15.00, 5.0)
-        }
-
-        model, cost, latency = model_map[complexity]
+        model, cost, latency = _COMPLEXITY_ROUTING[complexity]
 
         # If confidence is low, escalate to better model
         if confidence < 0.5:
-            model, cost, latency = model_map[ComplexityLevel.HIGH]
+            model, cost, latency = _COMPLEXITY_ROUTING[ComplexityLevel.HIGH]
             reasoning = f"Low confidence ({confidence:.2f}), escalating to {model}"
             provider = "google"  # gemini-2.5-pro
         else:
@@ -253,25 +343,9 @@ class DynamicRouter(BaseRouter):
         Returns:
             Dictionary with {complexity: ComplexityLevel, confidence: float}
         """
-        word_count = len(document.split())
-        sentence_count = document.count('.') + document.count('!') + document.count('?')
-        avg_sentence_length = word_count / max(sentence_count, 1)
-
-        # Heuristic: longer sentences = more complex
-        if avg_sentence_length > 25:
-            complexity = ComplexityLevel.HIGH
-            confidence = 0.7
-        elif avg_sentence_length > 15:
-            complexity = ComplexityLevel.MEDIUM
-            confidence = 0.8
-        else:
-            complexity = ComplexityLevel.LOW
-            confidence = 0.9
-
-        # Adjust for document length
-        if word_count > 2000:
-            complexity = ComplexityLevel.HIGH
-            confidence *= 0.9
+        # Memoized on document content: retries and fallback re-routing
+        # of the same document skip the text scans
+        complexity, confidence, avg_sentence_length, word_count = _classify_document(document)
 
         return {
             'complexity': complexity,
@@ -281,6 +355,115 @@ class DynamicRouter(BaseRouter):
         }
 
 
+# Sentence-terminating punctuation counted by the default classifier
+_SENTENCE_MARKS = b'.!?'
+
+
+def _scan_document(document: str) -> Tuple[int, int]:
+    """Count words and sentence-terminating punctuation
+
+    The only text-scanning step of the default classifier; both counts
+    run in C. For ASCII text (checked in O(1)) the marks are removed in
+    one bytes.translate pass over a straight-copy encoding, instead of
+    scanning the text once per mark; other text falls back to str.count.
+
+    Args:
+        document: Document content
+
+    Returns:
+        Tuple of (word_count, sentence_count)
+    """
+    word_count = len(document.split())
+    if document.isascii():
+        data = document.encode('ascii')
+        return word_count, len(data) - len(data.translate(None, _SENTENCE_MARKS))
+    return word_count, document.count('.') + document.count('!') + document.count('?')
+
+
+# Default-classifier results by document digest, LRU order (oldest first)
+_CLASSIFY_MEMO: Dict[bytes, Tuple[ComplexityLevel, float, float, int]] = OrderedDict()
+_CLASSIFY_MEMO_LOCK = threading.Lock()
+_CLASSIFY_MEMO_SIZE = 4096
+
+
+def _classify_document(document: str) -> Tuple[ComplexityLevel, float, float, int]:
+    """Heuristic complexity classification (memoized per document)
+
+    Design Decision: The memo is keyed on a 128-bit BLAKE2b digest, not
+    the document itself, so it holds 4096 small keys rather than up to
+    4096 full documents. Hashing runs in C and is still much cheaper
+    than the word split it saves.
+
+    Args:
+        document: Document content
+
+    Returns:
+        Tuple of (complexity, confidence, avg_sentence_length, word_count)
+    """
+    digest = hashlib.blake2b(
+        document.encode('utf-8', 'surrogatepass'), digest_size=16
+    ).digest()
+
+    with _CLASSIFY_MEMO_LOCK:
+        result = _CLASSIFY_MEMO.get(digest)
+        if result is not None:
+            _CLASSIFY_MEMO.move_to_end(digest)
+            return result
+
+    result = _classify_counts(*_scan_document(document))
+
+    with _CLASSIFY_MEMO_LOCK:
+        _CLASSIFY_MEMO[digest] = result
+        if len(_CLASSIFY_MEMO) > _CLASSIFY_MEMO_SIZE:
+            _CLASSIFY_MEMO.popitem(last=False)
+    return result
+
+
+def _classify_counts(
+    word_count: int,
+    sentence_count: int
+) -> Tuple[ComplexityLevel, float, float, int]:
+    """Numeric core of the default classifier
+
+    Kept free of string handling so the text scans stay in C and this
+    part is a handful of comparisons.
+
+    Args:
+        word_count: Number of words
+        sentence_count: Number of sentence-terminating marks
+
+    Returns:
+        Tuple of (complexity, confidence, avg_sentence_length, word_count)
+    """
+    avg_sentence_length = word_count / max(sentence_count, 1)
+
+    # Heuristic: longer sentences = more complex
+    if avg_sentence_length > 25:
+        complexity = ComplexityLevel.HIGH
+        confidence = 0.7
+    elif avg_sentence_length > 15:
+        complexity = ComplexityLevel.MEDIUM
+        confidence = 0.8
+    else:
+        complexity = ComplexityLevel.LOW
+        confidence = 0.9
+
+    # Adjust for document length
+    if word_count > 2000:
+        complexity = ComplexityLevel.HIGH
+        confidence *= 0.9
+
+    return complexity, confidence, avg_sentence_length, word_count
+
+
+# Estimated cost per 1K tokens for ensemble members (unknown models: 1.0)
+ENSEMBLE_MODEL_COSTS = MappingProxyType({
+    'gpt-4o': 2.5,
+    'claude-3.5-sonnet': 3.0,
+    'gemini-2.5-flash': 0.3
+})
+
+
 class EnsembleRouter(BaseRouter):
     """Ensemble routing - runs multiple models and aggregates results
 
@@ -299,6 +482,11 @@ class EnsembleRouter(BaseRouter):
         self.models = models
         self.aggregation = aggregation
 
+        # The roster is fixed at construction, so the decision fields are too
+        self._model = f"ensemble({','.join(models)})"
+        self._total_cost = sum(ENSEMBLE_MODEL_COSTS.get(m, 1.0) for m in models)
+        self._reasoning = f"Ensemble routing: {len(models)} models with {aggregation} aggregation"  # Renamed from rationale
+
     def route(self, document: str, metadata: Dict) -> RoutingDecision:
         """Route to ensemble of models
 
@@ -312,27 +500,103 @@ class EnsembleRouter(BaseRouter):
         Returns:
             RoutingDecision with list of models
         """
-        # Estimate cost and latency for ensemble
-        model_costs = {
-            'gpt-4o': 2.5,
-            'claude-3.5-sonnet': 3.0,
-            'gemini-2.5-flash': 0.3
-        }
-
-        total_cost = sum(model_costs.get(m, 1.0) for m in self.models)
         avg_latency = 3.0  # Ensemble can run in parallel
 
         return RoutingDecision(
-            model=f"ensemble({','.join(self.models)})",
+            model=self._model,
             provider="ensemble",  # Multiple providers
             strategy=RoutingStrategy.ENSEMBLE,
             complexity=ComplexityLevel.HIGH,
             confidence=0.95,  # High confidence due to multiple models
-            reasoning=f"Ensemble routing: {len(self.models)} models with {self.aggregation} aggregation",  # Renamed from rationale
-            estimated_cost=total_cost,
+            reasoning=self._reasoning,
+            estimated_cost=self._total_cost,
             estimated_latency=avg_latency
         )
 
+    async def execute_ensemble(
+        self,
+        document: str,
+        call_model: Callable[[str, str], Awaitable[Any]],
+        max_concurrent: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run all ensemble models concurrently and aggregate their results
+
+        Models run in parallel, so the ensemble takes roughly the slowest
+        model's latency rather than the sum. A semaphore bounds in-flight
+        calls to respect provider rate limits; wrap call_model with
+        RetryHandler.aretry for per-model retries.
+
+        Args:
+            document: Document content
+            call_model: Async function (model, document) -> result; results
+                        must be hashable for aggregation
+            max_concurrent: Maximum concurrent calls (None = all models)
+
+        Returns:
+            Dictionary with {result: aggregated result (None if no
+            agreement), results: {model: result}, errors: {model: exception}}
+
+        Raises:
+            ValueError: If aggregation strategy is unsupported
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or len(self.models) or 1)
+
+        async def run_one(model: str) -> Any:
+            async with semaphore:
+                return await call_model(model, document)
+
+        outcomes = await asyncio.gather(
+            *(run_one(model) for model in self.models),
+            return_exceptions=True
+        )
+
+        results = {}
+        errors = {}
+        for model, outcome in zip(self.models, outcomes):
+            # gather() also returns CancelledError and other BaseExceptions
+            if isinstance(outcome, BaseException):
+                errors[model] = outcome
+            else:
+                results[model] = outcome
+
+        return {
+            'result': self._aggregate(results, errors),
+            'results': results,
+            'errors': errors
+        }
+
+    def _aggregate(self, results: Dict[str, Any], errors: Dict[str, BaseException]) -> Any:
+        """Combine per-model results according to self.aggregation
+
+        Args:
+            results: Successful results by model
+            errors: Failures by model
+
+        Returns:
+            Aggregated result, or None if there is no agreement
+
+        Raises:
+            ValueError: If aggregation strategy is unsupported
+        """
+        if self.aggregation == "voting":
+            # Ties go to the result seen first (models in ensemble order)
+            votes = Counter(results.values())
+            return votes.most_common(1)[0][0] if votes else None
+
+        elif self.aggregation == "consensus":
+            distinct = set(results.values())
+            return distinct.pop() if len(distinct) == 1 and not errors else None
+
+        elif self.aggregation == "weighted":
+            # Weight each model's vote by its cost (pricier = stronger model)
+            scores: Dict[Any, float] = {}
+            for model, result in results.items():
+                scores[result] = scores.get(result, 0.0) + ENSEMBLE_MODEL_COSTS.get(model, 1.0)
+            return max(scores, key=scores.get) if scores else None
+
+        else:
+            raise ValueError(f"Unsupported aggregation strategy: {self.aggregation}")
+
 
 class ModelRouter:
     """Main model router with fallback chain
@@ -360,6 +624,13 @@ class ModelRouter:
         self.fallback_chain = fallback_chain or ['gpt-4o', 'claude-3.5-sonnet', 'gemini-2.5-pro']
         self.max_cost_per_doc = max_cost_per_doc
 
+        # Next-pointer per model (first occurrence wins, as with list.index);
+        # models outside the chain fall back to its head
+        self._next_fallback: Dict[str, Optional[str]] = {}
+        for model, next_model in zip(self.fallback_chain, self.fallback_chain[1:] + [None]):
+            self._next_fallback.setdefault(model, next_model)
+        self._first_fallback = self.fallback_chain[0] if self.fallback_chain else None
+
     def route(self, document: str, metadata: Optional[Dict] = None) -> RoutingDecision:
         """Route document to optimal model
 
@@ -387,6 +658,74 @@ class ModelRouter:
 
         return decision
 
+    def route_into(
+        self,
+        document: str,
+        metadata: Optional[Dict],
+        out: RoutingDecision
+    ) -> RoutingDecision:
+        """Route document, writing the decision into a reusable object
+
+        Args:
+            document: Document content
+            metadata: Document metadata
+            out: Decision object to overwrite (e.g. one reused per worker)
+
+        Returns:
+            out, updated in place
+
+        Raises:
+            ValueError: If estimated cost exceeds max_cost_per_doc
+        """
+        decision = self.primary_strategy.route_into(document, metadata or {}, out)
+
+        # Check cost constraint
+        if decision.estimated_cost > self.max_cost_per_doc:
+            raise ValueError(
+                f"Estimated cost ${decision.estimated_cost:.2f} exceeds "
+                f"maximum ${self.max_cost_per_doc:.2f}"
+            )
+
+        return decision
+
+    def route_batch(
+        self,
+        documents: List[str],
+        metadatas: Optional[List[Dict]] = None
+    ) -> List[RoutingDecision]:
+        """Route a corpus of documents in one call
+
+        Args:
+            documents: Document contents
+            metadatas: Metadata for each document (defaults to empty dicts)
+
+        Returns:
+            RoutingDecision per document, in input order
+
+        Raises:
+            ValueError: If metadatas length differs from documents, or any
+                        estimated cost exceeds max_cost_per_doc
+        """
+        if metadatas is None:
+            metadatas = [{} for _ in documents]
+        elif len(metadatas) != len(documents):
+            raise ValueError(
+                f"Got {len(metadatas)} metadata entries for {len(documents)} documents"
+            )
+
+        decisions = self.primary_strategy.route_batch(documents, metadatas)
+
+        # Check cost constraint
+        max_cost = self.max_cost_per_doc
+        for decision in decisions:
+            if decision.estimated_cost > max_cost:
+                raise ValueError(
+                    f"Estimated cost ${decision.estimated_cost:.2f} exceeds "
+                    f"maximum ${max_cost:.2f}"
+                )
+
+        return decisions
+
     def get_fallback_model(self, failed_model: str) -> Optional[str]:
         """Get next fallback model
 
@@ -396,13 +735,4 @@ class ModelRouter:
         Returns:
             Next fallback model, or None if no fallbacks remain
         """
-        try:
-            current_index = self.fallback_chain.index(failed_model)
-            if current_index + 1 < len(self.fallback_chain):
-                return self.fallback_chain[current_index + 1]
-        except ValueError:
-            # failed_model not in fallback_chain, return first fallback
-            if self.fallback_chain:
-                return self.fallback_chain[0]
-
-        return None
+        return self._next_fallback.get(failed_model, self._first_fallback)
@@ -9,11 +9,14 @@ Handles transient failures in LLM API calls with:
 Based on L208 lines 27-32 (LLM-Powered Processing Pipeline - Retry logic)
 """
 
-from typing import Callable, Optional, List, Any
-from dataclasses import dataclass
+from typing import Callable, Optional, Any, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
+import asyncio
+import inspect
 import time
 import random
+import re
 
 
 class ErrorType(Enum):
@@ -26,7 +29,44 @@ class ErrorType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Error types retried when RetryConfig.retryable_errors is not given
+_DEFAULT_RETRYABLE = frozenset({
+    ErrorType.RATE_LIMIT,
+    ErrorType.TIMEOUT,
+    ErrorType.SERVER_ERROR,
+    ErrorType.NETWORK_ERROR,
+    ErrorType.UNKNOWN  # Default to retryable for safety
+})
+
+# Upper bound on RetryConfig.backoff_delays length
+_MAX_PRECOMPUTED_DELAYS = 32
+
+# Error message terms per ErrorType, in classification priority order
+_ERROR_TERMS = (
+    (ErrorType.RATE_LIMIT, ('429', 'rate limit', 'too many requests')),
+    (ErrorType.TIMEOUT, ('timeout', 'timed out')),
+    (ErrorType.SERVER_ERROR, ('500', '502', '503', '504')),
+    (ErrorType.NETWORK_ERROR, ('connection', 'network', 'dns')),
+    (ErrorType.CLIENT_ERROR, ('400', '401', '403', '404')),
+)
+_ERROR_TERM_RANK = {
+    term: rank for rank, (_, terms) in enumerate(_ERROR_TERMS) for term in terms
+}
+_ERROR_DISPATCH = {
+    term: error_type for error_type, terms in _ERROR_TERMS for term in terms
+}
+
+# All terms in one alternation; the lookahead reports overlapping matches
+# (e.g. '429' inside '40429') so priority is decided exactly as by
+# independent substring checks. Matched against str.lower() output rather
+# than with re.IGNORECASE, whose Unicode case folding would also match
+# variants such as 'dnſ' that are not keys of the tables above.
+_ERROR_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _ERROR_TERM_RANK)) + '))'
+)
+
+
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry behavior"""
     max_attempts: int = 3              # Renamed from 'max_retries' for API consistency
@@ -34,21 +74,40 @@ class RetryConfig:
     max_delay: float = 60.0            # Maximum delay in seconds
     exponential_base: float = 2.0      # Multiplier for exponential backoff
     jitter: bool = True                # Add randomness to prevent thundering herd
-    retryable_errors: List[ErrorType] = None
+    retryable_errors: Optional[Iterable[ErrorType]] = None  # Stored as a frozenset
+    max_total_delay: Optional[float] = None  # Backoff budget in seconds (None = unlimited)
+    _backoff_key: tuple = field(default=(), init=False, repr=False, compare=False)
+    _backoff_table: tuple = field(default=(), init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Set default retryable errors"""
+        """Set default retryable errors
+
+        retryable_errors is stored as a frozenset for O(1) membership.
+        """
         if self.retryable_errors is None:
-            self.retryable_errors = [
-                ErrorType.RATE_LIMIT,
-                ErrorType.TIMEOUT,
-                ErrorType.SERVER_ERROR,
-                ErrorType.NETWORK_ERROR,
-                ErrorType.UNKNOWN  # Default to retryable for safety
-            ]
+            self.retryable_errors = _DEFAULT_RETRYABLE
+        elif not isinstance(self.retryable_errors, frozenset):
+            self.retryable_errors = frozenset(self.retryable_errors)
 
+    @property
+    def backoff_delays(self) -> tuple:
+        """Capped, un-jittered delay per attempt (index attempt - 1)
 
-@dataclass
+        Built on first use and rebuilt whenever the backoff fields have
+        changed since, so reassigning e.g. base_delay takes effect.
+        """
+        key = (self.base_delay, self.max_delay, self.exponential_base, self.max_attempts)
+        if key != self._backoff_key:
+            # Bounded so huge max_attempts cannot overflow float pow up front
+            self._backoff_table = tuple(
+                min(self.base_delay * (self.exponential_base ** i), self.max_delay)
+                for i in range(min(self.max_attempts, _MAX_PRECOMPUTED_DELAYS))
+            )
+            self._backoff_key = key
+        return self._backoff_table
+
+
+@dataclass(slots=True)
 class RetryResult:
     """Result of retry operation"""
     success: bool
@@ -56,6 +115,7 @@ class RetryResult:
     error: Optional[Exception] = None
     attempts: int = 0
     total_delay: float = 0.0
+    deadline_exceeded: bool = False    # Stopped early: next backoff would exceed max_total_delay
 
 
 class RetryHandler:
@@ -78,6 +138,9 @@ class RetryHandler:
             config: Retry configuration (uses defaults if None)
         """
         self.config = config or RetryConfig()
+        # Private jitter source, not the shared module RNG; bound once so
+        # each draw is a single C call
+        self._uniform = random.Random().random
 
     def retry(
         self,
@@ -95,12 +158,14 @@ class RetryHandler:
             RetryResult with outcome
         """
         classifier = error_classifier or self._default_error_classifier
+        retryable = self.config.retryable_errors
+        max_attempts = self.config.max_attempts
 
         attempts = 0
         total_delay = 0.0
         last_error = None
 
-        while attempts <= self.config.max_attempts:
+        while attempts <= max_attempts:
             try:
                 # Attempt execution
                 result = func()
@@ -119,7 +184,7 @@ class RetryHandler:
                 error_type = classifier(e)
 
                 # Check if error is retryable
-                if error_type not in self.config.retryable_errors:
+                if error_type not in retryable:
                     # Non-retryable error, fail immediately
                     return RetryResult(
                         success=False,
@@ -129,15 +194,109 @@ class RetryHandler:
                     )
 
                 # Check if max retries exceeded
-                if attempts > self.config.max_attempts:
+                if attempts > max_attempts:
                     break
 
                 # Calculate delay
                 delay = self._calculate_delay(attempts)
-                total_delay += delay
 
-                # Wait before retry
-                time.sleep(delay)
+                # Give up now rather than sleep past the backoff budget
+                if self._exceeds_budget(total_delay, delay):
+                    return RetryResult(
+                        success=False,
+                        error=e,
+                        attempts=attempts,
+                        total_delay=total_delay,
+                        deadline_exceeded=True
+                    )
+
+                # Wait before retry; total_delay records time actually
+                # spent backing off, measured on the monotonic clock
+                sleep_start = time.monotonic()
+                self._sleep_until(sleep_start + delay)
+                total_delay += time.monotonic() - sleep_start
+
+        # All retries exhausted
+        return RetryResult(
+            success=False,
+            error=last_error,
+            attempts=attempts,
+            total_delay=total_delay
+        )
+
+    async def aretry(
+        self,
+        func: Callable,
+        error_classifier: Optional[Callable[[Exception], ErrorType]] = None
+    ) -> RetryResult:
+        """Execute async function with retry logic
+
+        Same control flow as retry(), but backs off with asyncio.sleep so
+        other tasks on the event loop keep running during the delay.
+
+        Args:
+            func: Coroutine function (or function returning an awaitable)
+                  to execute, taking no arguments
+            error_classifier: Function to classify exceptions into ErrorType
+                            If None, uses default classifier
+
+        Returns:
+            RetryResult with outcome
+        """
+        classifier = error_classifier or self._default_error_classifier
+        retryable = self.config.retryable_errors
+        max_attempts = self.config.max_attempts
+
+        attempts = 0
+        total_delay = 0.0
+        last_error = None
+
+        while attempts <= max_attempts:
+            try:
+                # Attempt execution
+                result = func()
+                if inspect.isawaitable(result):
+                    result = await result
+                return RetryResult(
+                    success=True,
+                    result=result,
+                    attempts=attempts + 1,
+                    total_delay=total_delay
+                )
+
+            except Exception as e:
+                last_error = e
+                attempts += 1
+
+                # Non-retryable error, fail immediately
+                if classifier(e) not in retryable:
+                    return RetryResult(
+                        success=False,
+                        error=e,
+                        attempts=attempts,
+                        total_delay=total_delay
+                    )
+
+                # Check if max retries exceeded
+                if attempts > max_attempts:
+                    break
+
+                # Wait before retry without blocking the event loop
+                delay = self._calculate_delay(attempts)
+
+                # Give up now rather than sleep past the backoff budget
+                if self._exceeds_budget(total_delay, delay):
+                    return RetryResult(
+                        success=False,
+                        error=e,
+                        attempts=attempts,
+                        total_delay=total_delay,
+                        deadline_exceeded=True
+                    )
+
+                sleep_start = time.monotonic()
+                await asyncio.sleep(delay)
+                total_delay += time.monotonic() - sleep_start
 
         # All retries exhausted
         return RetryResult(
@@ -158,52 +317,72 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: delay = base * (exponential_base ^ (attempt - 1))
-        delay = self.config.base_delay * (self.config.exponential_base ** (attempt - 1))
+        delays = self.config.backoff_delays
+        if attempt <= len(delays):
+            delay = delays[attempt - 1]
+        else:
+            # Exponential backoff: delay = base * (exponential_base ^ (attempt - 1))
+            delay = self.config.base_delay * (self.config.exponential_base ** (attempt - 1))
 
-        # Cap at max delay
-        delay = min(delay, self.config.max_delay)
+            # Cap at max delay
+            delay = min(delay, self.config.max_delay)
 
         # Add jitter if enabled
         if self.config.jitter:
             # Random value between 0 and delay
-            delay = random.uniform(0, delay)
+            delay = self._uniform() * delay
 
         return delay
 
-    def _default_error_classifier(self, error: Exception) -> ErrorType:
-        """Default error classification
+    def _exceeds_budget(self, total_delay: float, delay: float) -> bool:
+        """Check whether the next backoff would exceed max_total_delay
 
         Args:
-            error: Exception to classify
+            total_delay: Backoff time spent so far
+            delay: Next backoff delay
 
         Returns:
-            ErrorType classification
+            True if a budget is set and would be exceeded
         """
-        error_msg = str(error).lower()
+        budget = self.config.max_total_delay
+        return budget is not None and total_delay + delay > budget
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> None:
+        """Sleep until an absolute time.monotonic() deadline
 
-        # Rate limit errors
-        if '429' in error_msg or 'rate limit' in error_msg or 'too many requests' in error_msg:
-            return ErrorType.RATE_LIMIT
+        Sleeping toward a fixed deadline absorbs early wake-ups instead of
+        letting relative sleeps drift.
+
+        Args:
+            deadline: Monotonic timestamp to wake at
+        """
+        remaining = deadline - time.monotonic()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = deadline - time.monotonic()
 
-        # Timeout errors
-        if 'timeout' in error_msg or 'timed out' in error_msg:
-            return ErrorType.TIMEOUT
+    @staticmethod
+    def _default_error_classifier(error: Exception) -> ErrorType:
+        """Default error classification
 
-        # Server errors (5xx)
-        if any(code in error_msg for code in ['500', '502', '503', '504']):
-            return ErrorType.SERVER_ERROR
+        Args:
+            error: Exception to classify
 
-        # Network errors
-        if any(term in error_msg for term in ['connection', 'network', 'dns']):
-            return ErrorType.NETWORK_ERROR
+        Returns:
+            ErrorType classification
+        """
+        # Single regex pass over the message for every known term
+        matches = _ERROR_PATTERN.findall(str(error).lower())
+        if not matches:
+            # Unknown error type (default to retryable for safety)
+            return ErrorType.UNKNOWN
 
-        # Client errors (4xx, excluding 429)
-        if any(code in error_msg for code in ['400', '401', '403', '404']):
-            return ErrorType.CLIENT_ERROR
+        if len(matches) == 1:
+            return _ERROR_DISPATCH[matches[0]]
 
-        # Unknown error type (default to retryable for safety)
-        return ErrorType.UNKNOWN
+        # Several terms: the highest-priority type wins
+        return _ERROR_TERMS[min(_ERROR_TERM_RANK[term] for term in matches)][0]
 
 
 class RetryDecorator:
@@ -249,6 +428,45 @@ class RetryDecorator:
         return wrapper
 
 
+class AsyncRetryDecorator:
+    """Decorator for adding retry logic to coroutine functions
+
+    Example:
+        @AsyncRetryDecorator(max_attempts=3)
+        async def call_api():
+            return await api.request()
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0):
+        """Initialize async retry decorator
+
+        Args:
+            max_attempts: Maximum number of retry attempts
+            base_delay: Base delay in seconds for exponential backoff
+        """
+        self.config = RetryConfig(max_attempts=max_attempts, base_delay=base_delay)
+        self.handler = RetryHandler(self.config)
+
+    def __call__(self, func: Callable) -> Callable:
+        """Wrap coroutine function with retry logic
+
+        Args:
+            func: Coroutine function to wrap
+
+        Returns:
+            Wrapped coroutine function
+        """
+        async def wrapper(*args, **kwargs):
+            result = await self.handler.aretry(lambda: func(*args, **kwargs))
+
+            if result.success:
+                return result.result
+            else:
+                raise result.error
+
+        return wrapper
+
+
 def with_retry(
     func: Callable,
     max_attempts: int = 3,
@@ -9,10 +9,26 @@ Validates LLM outputs against defined schemas to ensure:
 Based on L208 lines 247-251, 565-568 (Validation Pipeline, Schema Enforcement)
 """
 
-from typing import Dict, List, Any, Optional, Type
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Type, Callable, Union
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
+from types import MappingProxyType
 import re
+import sys
+
+from security.patterns import (
+    HTML_TAG_RE, SQL_INJECTION_RE, SQL_COMMENT_RE, ascii_variant, html_tag_endpos
+)
+
+try:
+    import msgspec
+except ImportError:  # Optional: only needed for SchemaValidator.from_msgspec
+    msgspec = None
+
+
+# SchemaField attributes baked into its compiled validator
+_FIELD_CONSTRAINTS = frozenset({'field_type', 'min_length', 'max_length', 'pattern', 'allowed_values'})
 
 
 class FieldType(Enum):
@@ -28,6 +44,41 @@ class FieldType(Enum):
     OBJECT = "object"
 
 
+# Field named in a msgspec.ValidationError message
+_MSGSPEC_FIELD_RE = re.compile(r"at `\$\.([^`.\[]+)|required field `([^`]+)`")
+
+# FieldType -> Python type(s) accepted by isinstance (add_field)
+_FIELD_TYPE_TO_PY = MappingProxyType({
+    FieldType.STRING: str,
+    FieldType.NUMBER: (int, float),
+    FieldType.BOOLEAN: bool,
+    FieldType.ARRAY: list,
+    FieldType.OBJECT: dict
+})
+
+# Type names accepted in dict schema definitions (create_from_dict)
+_STR_TO_PY_TYPE = MappingProxyType({
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+    'dict': dict
+})
+
+
+def _intern_name(name: Any) -> Any:
+    """Intern a field name so lookups from validate() short-circuit on identity
+
+    Args:
+        name: Field name (non-str keys are returned unchanged)
+
+    Returns:
+        Interned name
+    """
+    return sys.intern(name) if type(name) is str else name
+
+
 class ValidationSeverity(Enum):
     """Validation issue severity"""
     ERROR = "error"
@@ -35,7 +86,7 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Validation issue found in output"""
     field: str
@@ -45,22 +96,56 @@ class ValidationIssue:
     actual: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of schema validation"""
+    """Result of schema validation
+
+    Design Decision: errors/warnings are partitioned once and cached
+    rather than rescanned on every access. Issues appended later (e.g. by
+    SchemaValidator's security pass) are folded in incrementally, and the
+    cache is rebuilt if issues is replaced or shrinks. Treat issues as
+    append-only: replacing an item in place (issues[0] = ...) is not
+    detected and leaves errors/warnings stale. errors/warnings return
+    fresh lists, so callers may modify them freely.
+    """
     is_valid: bool  # Renamed from 'valid' per API Specification v1.0
     issues: List[ValidationIssue]
     validated_data: Optional[Dict] = None
+    _errors: List[ValidationIssue] = field(default_factory=list, init=False, repr=False, compare=False)
+    _warnings: List[ValidationIssue] = field(default_factory=list, init=False, repr=False, compare=False)
+    _partitioned: int = field(default=0, init=False, repr=False, compare=False)
+    _partitioned_issues: Optional[List[ValidationIssue]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def errors(self) -> List[ValidationIssue]:
-        """Get error-level issues"""
-        return [i for i in self.issues if i.severity == ValidationSeverity.ERROR]
+        """Get error-level issues (a new list on each access)"""
+        self._partition()
+        return list(self._errors)
 
     @property
     def warnings(self) -> List[ValidationIssue]:
-        """Get warning-level issues"""
-        return [i for i in self.issues if i.severity == ValidationSeverity.WARNING]
+        """Get warning-level issues (a new list on each access)"""
+        self._partition()
+        return list(self._warnings)
+
+    def _partition(self) -> None:
+        """Sort any issues not yet seen into the errors/warnings caches"""
+        issues = self.issues
+        if issues is not self._partitioned_issues or len(issues) < self._partitioned:
+            self._errors = []
+            self._warnings = []
+            self._partitioned = 0
+            self._partitioned_issues = issues
+
+        if len(issues) == self._partitioned:
+            return
+
+        for issue in islice(issues, self._partitioned, None):
+            if issue.severity == ValidationSeverity.ERROR:
+                self._errors.append(issue)
+            elif issue.severity == ValidationSeverity.WARNING:
+                self._warnings.append(issue)
+        self._partitioned = len(issues)
 
 
 class SchemaField:
@@ -68,6 +153,13 @@ class SchemaField:
 
     Design Decision: Pydantic-inspired but simplified.
     For production, consider using Pydantic directly.
+
+    Design Decision: The checks a field needs are fixed once its
+    constraints are set, so validate() runs a closure specialized to
+    them (compiled regex, frozenset of allowed values, no branches for
+    unset constraints). Assigning any constraint attribute discards the
+    closure and it is rebuilt on next use; mutate constraints by
+    assignment, not in place.
     """
 
     def __init__(
@@ -98,6 +190,13 @@ class SchemaField:
         self.pattern = pattern
         self.allowed_values = allowed_values
         self.description = description
+        self._validator = self._compile_validator()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, dropping the compiled validator if a constraint changed"""
+        object.__setattr__(self, name, value)
+        if name in _FIELD_CONSTRAINTS:
+            object.__setattr__(self, '_validator', None)
 
     def validate(self, field_name: str, value: Any) -> List[ValidationIssue]:
         """Validate field value
@@ -109,57 +208,104 @@ class SchemaField:
         Returns:
             List of validation issues (empty if valid)
         """
-        issues = []
+        validator = self._validator
+        if validator is None:
+            validator = self._validator = self._compile_validator()
+        return validator(field_name, value)
 
-        # Type validation
-        if not isinstance(value, self.field_type):
-            issues.append(ValidationIssue(
+    def _compile_validator(self) -> Callable[[str, Any], List[ValidationIssue]]:
+        """Build a validate function specialized to this field's constraints
+
+        Returns:
+            Function (field_name, value) -> list of validation issues
+        """
+        field_type = self.field_type
+        min_length = self.min_length
+        max_length = self.max_length
+        pattern = self.pattern
+        pattern_re = re.compile(pattern) if pattern else None
+        allowed_values = self.allowed_values
+        check_length = min_length is not None or max_length is not None
+
+        # O(1) enum membership; the list itself is kept for error reporting
+        allowed_set = None
+        if allowed_values:
+            try:
+                allowed_set = frozenset(allowed_values)
+            except TypeError:
+                pass  # Unhashable allowed values: fall back to list scan
+        error = ValidationSeverity.ERROR
+
+        def type_mismatch(field_name: str, value: Any) -> List[ValidationIssue]:
+            return [ValidationIssue(
                 field=field_name,
-                severity=ValidationSeverity.ERROR,
+                severity=error,
                 message=f"Type mismatch",
-                expected=self.field_type.__name__,
+                expected=field_type.__name__,
                 actual=type(value).__name__
-            ))
-            return issues  # Don't continue validation if type is wrong
+            )]
 
-        # Length validation (strings and lists)
-        if isinstance(value, (str, list)):
-            length = len(value)
+        if not check_length and pattern_re is None and allowed_values is None:
+            # Type check only
+            def validate_type(field_name: str, value: Any) -> List[ValidationIssue]:
+                if isinstance(value, field_type):
+                    return []
+                return type_mismatch(field_name, value)
+            return validate_type
 
-            if self.min_length is not None and length < self.min_length:
-                issues.append(ValidationIssue(
-                    field=field_name,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Length {length} below minimum {self.min_length}"
-                ))
+        def validate_constraints(field_name: str, value: Any) -> List[ValidationIssue]:
+            # Don't continue validation if type is wrong
+            if not isinstance(value, field_type):
+                return type_mismatch(field_name, value)
+
+            issues = []
+
+            # Length validation (strings and lists)
+            if check_length and isinstance(value, (str, list)):
+                length = len(value)
 
-            if self.max_length is not None and length > self.max_length:
+                if min_length is not None and length < min_length:
+                    issues.append(ValidationIssue(
+                        field=field_name,
+                        severity=error,
+                        message=f"Length {length} below minimum {min_length}"
+                    ))
+
+                if max_length is not None and length > max_length:
+                    issues.append(ValidationIssue(
+                        field=field_name,
+                        severity=error,
+                        message=f"Length {length} exceeds maximum {max_length}"
+                    ))
+
+            # Pattern validation (strings only)
+            if pattern_re is not None and isinstance(value, str) and not pattern_re.match(value):
                 issues.append(ValidationIssue(
                     field=field_name,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Length {length} exceeds maximum {self.max_length}"
+                    severity=error,
+                    message=f"Does not match pattern: {pattern}"
                 ))
 
-        # Pattern validation (strings only)
-        if isinstance(value, str) and self.pattern:
-            if not re.match(self.pattern, value):
+            # Enum validation
+            if allowed_set is not None:
+                try:
+                    allowed = value in allowed_set
+                except TypeError:  # Unhashable value (e.g. list)
+                    allowed = value in allowed_values
+            else:
+                allowed = not allowed_values or value in allowed_values
+            if not allowed:
                 issues.append(ValidationIssue(
                     field=field_name,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Does not match pattern: {self.pattern}"
+                    severity=error,
+                    message=f"Value not in allowed list",
+                    expected=allowed_values,
+                    actual=value
                 ))
 
-        # Enum validation
-        if self.allowed_values and value not in self.allowed_values:
-            issues.append(ValidationIssue(
-                field=field_name,
-                severity=ValidationSeverity.ERROR,
-                message=f"Value not in allowed list",
-                expected=self.allowed_values,
-                actual=value
-            ))
+            return issues
 
-        return issues
+        return validate_constraints
 
 
 class Schema:
@@ -205,48 +351,50 @@ class Schema:
             description: Optional field description
         """
         # Map FieldType enum to Python type
-        type_mapping = {
-            FieldType.STRING: str,
-            FieldType.NUMBER: (int, float),
-            FieldType.BOOLEAN: bool,
-            FieldType.ARRAY: list,
-            FieldType.OBJECT: dict
-        }
-
-        python_type = type_mapping.get(field_type, str)
+        python_type = _FIELD_TYPE_TO_PY.get(field_type, str)
 
-        self.fields[name] = SchemaField(
+        self.fields[_intern_name(name)] = SchemaField(
             field_type=python_type,
             required=required,
             description=description or ""
         )
 
-    def validate(self, data: Dict[str, Any]) -> ValidationResult:
+    def validate(self, data: Dict[str, Any], report_unknown: bool = True) -> ValidationResult:
         """Validate data against schema
 
         Args:
             data: Data to validate
+            report_unknown: If False, fields not in the schema are accepted
+                silently instead of each producing a warning
 
         Returns:
             ValidationResult with issues
         """
         issues = []
+        has_error = False
+        fields = self.fields
 
         # Check required fields
-        for field_name, field_def in self.fields.items():
+        for field_name, field_def in fields.items():
             if field_def.required and field_name not in data:
                 issues.append(ValidationIssue(
                     field=field_name,
                     severity=ValidationSeverity.ERROR,
                     message="Required field missing"
                 ))
+                has_error = True
 
         # Validate present fields
         for field_name, value in data.items():
-            if field_name in self.fields:
-                field_issues = self.fields[field_name].validate(field_name, value)
-                issues.extend(field_issues)
-            else:
+            field_def = fields.get(field_name)
+            if field_def is not None:
+                field_issues = field_def.validate(field_name, value)
+                if field_issues:
+                    issues.extend(field_issues)
+                    has_error = has_error or any(
+                        i.severity == ValidationSeverity.ERROR for i in field_issues
+                    )
+            elif report_unknown:
                 # Unknown field (warning, not error)
                 issues.append(ValidationIssue(
                     field=field_name,
@@ -255,7 +403,75 @@ class Schema:
                 ))
 
         # Validation passes if no errors
-        valid = not any(i.severity == ValidationSeverity.ERROR for i in issues)
+        valid = not has_error
+
+        return ValidationResult(
+            is_valid=valid,
+            issues=issues,
+            validated_data=data if valid else None
+        )
+
+
+class MsgspecSchema:
+    """Schema backed by a msgspec.Struct type
+
+    Design Decision: For outputs already modelled as msgspec Structs,
+    msgspec's C validator replaces the per-field Python checks. It stops
+    at the first problem, so a failed validation reports one error
+    issue rather than one per field. Field-based Schema is unchanged -
+    msgspec's coercion rules (e.g. int accepted for float, bool rejected
+    for int) differ from isinstance checks, so it is not a drop-in
+    engine for SchemaField definitions.
+    """
+
+    def __init__(self, struct_type: Type):
+        """Initialize msgspec-backed schema
+
+        Args:
+            struct_type: msgspec.Struct subclass describing valid output
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        if msgspec is None:
+            raise ImportError("msgspec is required for MsgspecSchema (pip install msgspec)")
+        self.struct_type = struct_type
+        self.fields = dict.fromkeys(struct_type.__struct_fields__)
+
+    def validate(self, data: Dict[str, Any], report_unknown: bool = True) -> ValidationResult:
+        """Validate data against the Struct type
+
+        Args:
+            data: Data to validate
+            report_unknown: If False, fields not in the Struct are accepted
+                silently instead of each producing a warning
+
+        Returns:
+            ValidationResult with issues
+        """
+        issues = []
+
+        try:
+            msgspec.convert(data, self.struct_type, strict=True)
+            valid = True
+        except msgspec.ValidationError as e:
+            message = str(e)
+            match = _MSGSPEC_FIELD_RE.search(message)
+            issues.append(ValidationIssue(
+                field=(match.group(1) or match.group(2)) if match else "",
+                severity=ValidationSeverity.ERROR,
+                message=message
+            ))
+            valid = False
+
+        if report_unknown:
+            for field_name in data:
+                if field_name not in self.fields:
+                    issues.append(ValidationIssue(
+                        field=field_name,
+                        severity=ValidationSeverity.WARNING,
+                        message="Unknown field (not in schema)"
+                    ))
 
         return ValidationResult(
             is_valid=valid,
@@ -277,12 +493,13 @@ class SchemaValidator:
     See L208 lines 565-568 (Schema Enforcement as Security Boundary)
     """
 
-    def __init__(self, schema: Schema, strict_mode: bool = True):
+    def __init__(self, schema: Union[Schema, MsgspecSchema], strict_mode: bool = True):
         """Initialize schema validator
 
         Args:
             schema: Schema definition
-            strict_mode: If True, unknown fields cause validation failure
+            strict_mode: If True, unknown fields cause validation failure;
+                if False they are accepted without per-field warnings
         """
         self.schema = schema
         self.strict_mode = strict_mode
@@ -296,8 +513,11 @@ class SchemaValidator:
         Returns:
             ValidationResult
         """
-        # Run schema validation
-        result = self.schema.validate(llm_output)
+        # Run schema validation (permissive mode skips unknown-field warnings)
+        if self.strict_mode:
+            result = self.schema.validate(llm_output)
+        else:
+            result = self.schema.validate(llm_output, report_unknown=False)
 
         # Apply security validation
         security_issues = self._security_validation(llm_output)
@@ -349,8 +569,8 @@ class SchemaValidator:
         Returns:
             True if HTML detected
         """
-        html_pattern = r'<\s*(?:script|iframe|object|embed|img|svg|link|style)[^>]*>'
-        return bool(re.search(html_pattern, text, re.IGNORECASE))
+        pattern = ascii_variant(HTML_TAG_RE) if text.isascii() else HTML_TAG_RE
+        return pattern.search(text, 0, html_tag_endpos(text)) is not None
 
     def _contains_sql_injection(self, text: str) -> bool:
         """Check if text contains SQL injection patterns
@@ -361,19 +581,11 @@ class SchemaValidator:
         Returns:
             True if SQL patterns detected
         """
-        sql_patterns = [
-            r'\bDROP\s+TABLE\b',
-            r'\bUNION\s+SELECT\b',
-            r'\bDELETE\s+FROM\b',
-            r"'\s*OR\s+'1'\s*=\s*'1",
-            r"--\s*$"
-        ]
-
-        for pattern in sql_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-
-        return False
+        if text.isascii():
+            return (ascii_variant(SQL_INJECTION_RE).search(text) is not None
+                    or ascii_variant(SQL_COMMENT_RE).search(text) is not None)
+        return (SQL_INJECTION_RE.search(text) is not None
+                or SQL_COMMENT_RE.search(text) is not None)
 
     @staticmethod
     def create_from_dict(schema_dict: Dict) -> 'SchemaValidator':
@@ -389,20 +601,11 @@ class SchemaValidator:
         Returns:
             SchemaValidator instance
         """
-        type_map = {
-            'str': str,
-            'int': int,
-            'float': float,
-            'bool': bool,
-            'list': list,
-            'dict': dict
-        }
-
         fields = {}
         for field_name, field_spec in schema_dict.items():
-            field_type = type_map.get(field_spec.get('type', 'str'), str)
+            field_type = _STR_TO_PY_TYPE.get(field_spec.get('type', 'str'), str)
 
-            fields[field_name] = SchemaField(
+            fields[_intern_name(field_name)] = SchemaField(
                 field_type=field_type,
                 required=field_spec.get('required', True),
                 min_length=field_spec.get('min_length'),
@@ -414,3 +617,19 @@ class SchemaValidator:
 
         schema = Schema(fields)
         return SchemaValidator(schema)
+
+    @staticmethod
+    def from_msgspec(struct_type: Type, strict_mode: bool = True) -> 'SchemaValidator':
+        """Create validator from a msgspec.Struct type
+
+        Args:
+            struct_type: msgspec.Struct subclass describing valid output
+            strict_mode: If False, unknown fields are accepted silently
+
+        Returns:
+            SchemaValidator instance
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        return SchemaValidator(MsgspecSchema(struct_type), strict_mode=strict_mode)
@@ -6,9 +6,109 @@ incorporating into LLM prompts.
 Based on L208 lines 541-548 (Security Protocols - Prompt Injection Prevention)
 """
 
-from typing import Optional
+from typing import Dict, Optional
+from functools import lru_cache
+import json
 import re
-import html
+import threading
+
+try:
+    import hyperscan
+except ImportError:  # Optional: validate_output() falls back to re
+    hyperscan = None
+
+# Module-level compiled patterns (sanitize() and validate_output() may run
+# once per document in batch pipelines)
+_CTRL_TOKEN_RE = re.compile(r'<\|.*?\|>')
+_ROLE_RE = re.compile(r'\[(SYSTEM|ASSISTANT|USER|INSTRUCTION)\]', re.IGNORECASE)
+_FENCE_RE = re.compile(r'```.*?```', re.DOTALL)
+# Union of the three removal patterns (inline flags keep each one's own
+# semantics); used only as a "does anything need removing" gate
+_REMOVE_ANY_RE = re.compile(
+    r'<\|.*?\|>'
+    r'|(?i:\[(?:SYSTEM|ASSISTANT|USER|INSTRUCTION)\])'
+    r'|(?s:```.*?```)'
+)
+# html.escape(quote=True) replacements, in the order it applies them
+# ('&' first so the entities it inserts are not re-escaped)
+_HTML_ESCAPES = (
+    ('&', '&amp;'),
+    ('<', '&lt;'),
+    ('>', '&gt;'),
+    ('"', '&quot;'),
+    ('\'', '&#x27;'),
+)
+
+_OUT_CTRL_RE = _CTRL_TOKEN_RE
+_OUT_ROLE_RE = re.compile(r'\[(SYSTEM|ASSISTANT|USER)\]:', re.IGNORECASE)
+_OUT_TEMPLATE_RE = re.compile(r'You are a helpful assistant', re.IGNORECASE)
+_OUTPUT_CHECKS = (_OUT_CTRL_RE, _OUT_ROLE_RE, _OUT_TEMPLATE_RE)
+
+_OUTPUT_DATABASE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _output_database():
+    """Compile the validate_output() checks into one Hyperscan database
+
+    Design Decision: Only a yes/no answer is needed, so Hyperscan's
+    match events can be used directly (HS_FLAG_SINGLEMATCH caps them at
+    one per check). Used for ASCII output only, where its classes and caseless
+    matching agree with re.
+
+    Returns:
+        Compiled hyperscan.Database, or None if hyperscan is unavailable
+    """
+    if hyperscan is None:
+        return None
+
+    flags = []
+    for pattern in _OUTPUT_CHECKS:
+        flag = hyperscan.HS_FLAG_SINGLEMATCH
+        if pattern.flags & re.IGNORECASE:
+            flag |= hyperscan.HS_FLAG_CASELESS
+        flags.append(flag)
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.pattern.encode() for pattern in _OUTPUT_CHECKS],
+        ids=list(range(len(_OUTPUT_CHECKS))),
+        flags=flags
+    )
+    return database
+
+
+def _escape_html(text: str) -> str:
+    """Equivalent of html.escape(text) that skips absent characters
+
+    Design Decision: html.escape always runs five str.replace passes.
+    A membership test is several times cheaper than a replace that finds
+    nothing, and most text contains none (or only one or two) of the
+    special characters.
+
+    Args:
+        text: Text to escape
+
+    Returns:
+        Escaped text (text itself when nothing needs escaping)
+    """
+    for char, entity in _HTML_ESCAPES:
+        if char in text:
+            text = text.replace(char, entity)
+    return text
+
+
+@lru_cache(maxsize=32)
+def _delimiter_tag_re(delimiter: str) -> "re.Pattern[str]":
+    """Pattern matching the '<' of opening/closing tags for a delimiter
+
+    Args:
+        delimiter: Delimiter name
+
+    Returns:
+        Compiled pattern (case-insensitive)
+    """
+    return re.compile(rf'<(?=\s*/?\s*{re.escape(delimiter)}\b)', re.IGNORECASE)
 
 
 class InputSanitizer:
@@ -43,21 +143,62 @@ class InputSanitizer:
         Raises:
             ValueError: If input exceeds max_length
         """
-        if len(user_input) > self.max_length:
+        # Escaping commutes with whitespace normalization (entities hold
+        # no whitespace), so it can run last
+        return _escape_html(self._sanitize_core(user_input))
+
+    def sanitize_for_llm(
+        self,
+        user_input: str,
+        delimiter: str = "USER_CONTENT"
+    ) -> str:
+        """Sanitize user input that only an LLM will read
+
+        Skips HTML escaping, which costs extra tokens (e.g. ' becomes
+        &#x27;) and only matters if the text is later rendered as HTML.
+        Tags naming the delimiter get their '<' escaped, so the content
+        cannot close the delimiter block it is wrapped in.
+
+        Args:
+            user_input: Raw user input
+            delimiter: Delimiter name the content will be wrapped in
+
+        Returns:
+            Sanitized input, not HTML-escaped
+
+        Raises:
+            ValueError: If input exceeds max_length
+        """
+        sanitized = self._sanitize_core(user_input)
+
+        if '<' in sanitized:
+            sanitized = _delimiter_tag_re(delimiter).sub('&lt;', sanitized)
+
+        return sanitized
+
+    def _sanitize_core(self, user_input: str) -> str:
+        """Length check, special-token removal and whitespace normalization
+
+        Args:
+            user_input: Raw user input
+
+        Returns:
+            Sanitized input, not HTML-escaped
+
+        Raises:
+            ValueError: If input exceeds max_length
+        """
+        length = len(user_input)
+        if length > self.max_length:
             raise ValueError(
-                f"Input length {len(user_input)} exceeds maximum {self.max_length}"
+                f"Input length {length} exceeds maximum {self.max_length}"
             )
 
         # Remove special tokens that could confuse LLM
         sanitized = self._remove_special_tokens(user_input)
 
-        # Escape HTML
-        sanitized = html.escape(sanitized)
-
         # Remove excessive whitespace
-        sanitized = self._normalize_whitespace(sanitized)
-
-        return sanitized
+        return self._normalize_whitespace(sanitized)
 
     def wrap_with_delimiters(
         self,
@@ -88,21 +229,30 @@ class InputSanitizer:
     def build_safe_prompt(
         self,
         system_instruction: str,
-        user_content: str
+        user_content: str,
+        escape_html: bool = True
     ) -> str:
         """Build a safe prompt with clear separation
 
         Args:
             system_instruction: System-level instruction for LLM
             user_content: User-provided content
+            escape_html: HTML-escape the content (default). Pass False when
+                         the prompt is never rendered as HTML; see
+                         sanitize_for_llm()
 
         Returns:
             Complete prompt with sanitized content
         """
-        sanitized_content = self.sanitize(user_content)
-        wrapped_content = self.wrap_with_delimiters(sanitized_content)
+        if escape_html:
+            sanitized_content = self.sanitize(user_content)
+        else:
+            sanitized_content = self.sanitize_for_llm(user_content)
 
-        return f"{system_instruction}\n\n{wrapped_content}"
+        # Always go through wrap_with_delimiters so subclass and instance
+        # overrides apply; join sizes the result once
+        wrapped_content = self.wrap_with_delimiters(sanitized_content)
+        return "".join((system_instruction, "\n\n", wrapped_content))
 
     def _remove_special_tokens(self, text: str) -> str:
         """Remove special tokens that could manipulate LLM behavior
@@ -113,16 +263,32 @@ class InputSanitizer:
         Returns:
             Text with special tokens removed
         """
+        # Clean text (the common case) needs no removal passes at all;
+        # the substring checks run in C and skip even the regex gate
+        if '<|' not in text and '[' not in text and '```' not in text:
+            return text
+        if not _REMOVE_ANY_RE.search(text):
+            return text
+
+        # Design Decision: Sequential passes, not one fused sub. Removing a
+        # control token can join fragments into a role marker or fence
+        # (e.g. "[SYS<|x|>TEM]"), which the later passes must still catch.
+        # Each pass is skipped when its literal prefix is absent from the
+        # text as it stands after the previous passes.
+
         # Remove common LLM control tokens
         # Pattern: <|token_name|>
-        text = re.sub(r'<\|.*?\|>', '', text)
+        if '<|' in text:
+            text = _CTRL_TOKEN_RE.sub('', text)
 
         # Remove potential role injection attempts
         # Pattern: [SYSTEM], [ASSISTANT], [USER], etc.
-        text = re.sub(r'\[(SYSTEM|ASSISTANT|USER|INSTRUCTION)\]', '', text, flags=re.IGNORECASE)
+        if '[' in text:
+            text = _ROLE_RE.sub('', text)
 
         # Remove markdown code fence injection attempts
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+        if '```' in text:
+            text = _FENCE_RE.sub('', text)
 
         return text
 
@@ -135,11 +301,18 @@ class InputSanitizer:
         Returns:
             Text with normalized whitespace
         """
+        # Design Decision: Repeated str.replace instead of regex. Each
+        # pass at least shortens every run by a third, so long runs settle
+        # in a logarithmic number of C-level passes, and ordinary text
+        # needs one or none.
+
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        while '  ' in text:
+            text = text.replace('  ', ' ')
 
         # Replace multiple newlines with maximum of 2
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        while '\n\n\n' in text:
+            text = text.replace('\n\n\n', '\n\n')
 
         # Trim leading/trailing whitespace
         text = text.strip()
@@ -160,16 +333,26 @@ class InputSanitizer:
         Returns:
             True if output appears safe, False if suspicious
         """
+        database = _output_database()
+        if database is not None and llm_output.isascii():
+            suspicious = []
+            with _OUTPUT_DATABASE_LOCK:  # database scratch space is not thread-safe
+                database.scan(
+                    llm_output.encode('ascii'),
+                    match_event_handler=lambda *_: suspicious.append(True)
+                )
+            return not suspicious
+
         # Check for control token injection attempts
-        if re.search(r'<\|.*?\|>', llm_output):
+        if _OUT_CTRL_RE.search(llm_output):
             return False
 
         # Check for role injection in output
-        if re.search(r'\[(SYSTEM|ASSISTANT|USER)\]:', llm_output, re.IGNORECASE):
+        if _OUT_ROLE_RE.search(llm_output):
             return False
 
         # Check for prompt template injection
-        if re.search(r'You are a helpful assistant', llm_output, re.IGNORECASE):
+        if _OUT_TEMPLATE_RE.search(llm_output):
             return False
 
         return True
@@ -182,6 +365,9 @@ class PromptBuilder:
     that are resistant to injection attacks.
     """
 
+    # Distinct extraction schemas whose instruction text is kept
+    INSTRUCTION_CACHE_SIZE = 128
+
     def __init__(self, sanitizer: Optional[InputSanitizer] = None):
         """Initialize prompt builder
 
@@ -189,6 +375,8 @@ class PromptBuilder:
             sanitizer: Input sanitizer (creates default if None)
         """
         self.sanitizer = sanitizer or InputSanitizer()
+        # Compact schema JSON -> extraction instruction
+        self._instruction_cache: Dict[str, str] = {}
 
     def build_extraction_prompt(
         self,
@@ -204,16 +392,29 @@ class PromptBuilder:
         Returns:
             Safe prompt for extraction
         """
-        # Convert schema dict to string for prompt
-        import json
-        schema_str = json.dumps(extraction_schema, indent=2)
-
-        instruction = f"""Extract information according to this schema:
+        # Design Decision: Key the cache on the compact JSON (C encoder)
+        # rather than id(): schemas are mutable dicts, and the compact form
+        # pins down content and key order, which is all the indented form
+        # depends on. indent=2 forces json's pure-Python encoder, several
+        # times slower than the compact key.
+        schema_key = json.dumps(extraction_schema)
+        instruction = self._instruction_cache.get(schema_key)
+
+        if instruction is None:
+            # Convert schema dict to string for prompt
+            schema_str = json.dumps(extraction_schema, indent=2)
+
+            instruction = f"""Extract information according to this schema:
 {schema_str}
 
 Respond ONLY with the extracted data in the specified format.
 Do not include explanations or additional commentary."""
 
+            cache = self._instruction_cache
+            if len(cache) >= self.INSTRUCTION_CACHE_SIZE:
+                del cache[next(iter(cache))]  # Oldest first
+            cache[schema_key] = instruction
+
         return self.sanitizer.build_safe_prompt(instruction, document)
 
     def build_summarization_prompt(
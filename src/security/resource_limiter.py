@@ -23,9 +23,14 @@ class LimitType(Enum):
     COST = "cost"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceLimit:
-    """Definition of a resource limit"""
+    """Definition of a resource limit
+
+    Design Decision: The derived values stay properties for callers and
+    get_status(); the record_*/check_* hot paths compare the raw fields
+    inline instead.
+    """
     limit_type: LimitType
     limit_value: float
     current_value: float = 0.0
@@ -76,9 +81,20 @@ class ResourceLimiter:
     Design Decision: Fail-fast approach - stop processing immediately
     when limit is exceeded to prevent runaway costs.
 
+    Design Decision: The per-type limits are also held in direct slots
+    for the check_*/record_* hot paths (hashing a LimitType member runs
+    Python-level Enum.__hash__). They are the same objects as in
+    self.limits, so adjust limits in place (limits[...].limit_value = x)
+    rather than replacing dictionary entries.
+
     Based on L208 lines 570-576 (Work Bounding implementation)
     """
 
+    __slots__ = (
+        'limits', '_start_ns',
+        '_token_limit', '_time_limit', '_api_call_limit', '_cost_limit'
+    )
+
     def __init__(
         self,
         max_tokens: Optional[int] = None,
@@ -142,11 +158,18 @@ class ResourceLimiter:
                 1.0  # Default: $1.00
             )
 
-        self._start_time: Optional[float] = None
+        self._token_limit = self.limits[LimitType.TOKEN_COUNT]
+        self._time_limit = self.limits[LimitType.TIME]
+        self._api_call_limit = self.limits[LimitType.API_CALLS]
+        self._cost_limit = self.limits[LimitType.COST]
+
+        # time.monotonic_ns() at start_processing(); immune to wall-clock
+        # jumps (NTP steps, manual clock changes) that would distort time.time() differences
+        self._start_ns: Optional[int] = None
 
     def start_processing(self) -> None:
         """Start processing timer"""
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
     def check_token_limit(self, token_count: int) -> None:
         """Check if token count is within limit
@@ -157,7 +180,7 @@ class ResourceLimiter:
         Raises:
             ResourceLimitExceeded: If token limit would be exceeded
         """
-        limit = self.limits[LimitType.TOKEN_COUNT]
+        limit = self._token_limit
 
         if token_count > limit.limit_value:
             raise ResourceLimitExceeded(
@@ -174,11 +197,11 @@ class ResourceLimiter:
         Raises:
             ResourceLimitExceeded: If time limit exceeded
         """
-        if self._start_time is None:
+        if self._start_ns is None:
             return
 
-        elapsed = time.time() - self._start_time
-        limit = self.limits[LimitType.TIME]
+        elapsed = (time.monotonic_ns() - self._start_ns) / 1e9
+        limit = self._time_limit
 
         if elapsed >= limit.limit_value:
             raise ResourceLimitExceeded(
@@ -195,14 +218,15 @@ class ResourceLimiter:
         Raises:
             ResourceLimitExceeded: If API call limit exceeded
         """
-        limit = self.limits[LimitType.API_CALLS]
-        limit.current_value += 1
+        limit = self._api_call_limit
+        current = limit.current_value + 1
+        limit.current_value = current
 
-        if limit.exceeded:
+        if current >= limit.limit_value:
             raise ResourceLimitExceeded(
                 LimitType.API_CALLS,
                 limit.limit_value,
-                limit.current_value
+                current
             )
 
     def record_cost(self, cost_usd: float) -> None:
@@ -214,14 +238,15 @@ class ResourceLimiter:
         Raises:
             ResourceLimitExceeded: If cost limit exceeded
         """
-        limit = self.limits[LimitType.COST]
-        limit.current_value += cost_usd
+        limit = self._cost_limit
+        current = limit.current_value + cost_usd
+        limit.current_value = current
 
-        if limit.exceeded:
+        if current >= limit.limit_value:
             raise ResourceLimitExceeded(
                 LimitType.COST,
                 limit.limit_value,
-                limit.current_value
+                current
             )
 
     def get_status(self) -> dict:
@@ -245,7 +270,7 @@ class ResourceLimiter:
         """Reset all counters"""
         for limit in self.limits.values():
             limit.current_value = 0.0
-        self._start_time = None
+        self._start_ns = None
 
 
 class TimeoutContext:
@@ -257,6 +282,8 @@ class TimeoutContext:
             timer.check()  # Raises TimeoutError if exceeded
     """
 
+    __slots__ = ('max_seconds', 'check_interval', 'start_time', '_start_ns')
+
     def __init__(self, max_seconds: float, check_interval: float = 1.0):
         """Initialize timeout context
 
@@ -266,11 +293,13 @@ class TimeoutContext:
         """
         self.max_seconds = max_seconds
         self.check_interval = check_interval
-        self.start_time = None
+        self.start_time = None  # Wall-clock start, for callers
+        self._start_ns = None  # Monotonic start, used for the checks
 
     def __enter__(self):
         """Enter context"""
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -283,10 +312,10 @@ class TimeoutContext:
         Raises:
             TimeoutError: If timeout exceeded
         """
-        if self.start_time is None:
+        if self._start_ns is None:
             return
 
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self._start_ns) / 1e9
         if elapsed >= self.max_seconds:
             raise TimeoutError(
                 f"Operation timed out after {elapsed:.2f} seconds "
@@ -300,9 +329,9 @@ class TimeoutContext:
         Returns:
             Elapsed time in seconds
         """
-        if self.start_time is None:
+        if self._start_ns is None:
             return 0.0
-        return time.time() - self.start_time
+        return (time.monotonic_ns() - self._start_ns) / 1e9
 
 
 def with_resource_limits(
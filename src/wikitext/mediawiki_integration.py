@@ -11,9 +11,13 @@ Production use should implement actual HTTP requests.
 """
 
 from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from enum import Enum
 
+from .wikitext_parser import GMRKBParser
+
 
 class APIAction(Enum):
     """MediaWiki API actions"""
@@ -35,6 +39,20 @@ class WikiPage:
     metadata: Dict[str, Any]
 
 
+def _normalize_title(title: str) -> str:
+    """Apply MediaWiki's basic title normalization
+
+    Args:
+        title: Page title as requested or returned
+
+    Returns:
+        Title with underscores as spaces, runs of spaces collapsed,
+        surrounding whitespace removed and the first letter upper-cased
+    """
+    title = ' '.join(title.replace('_', ' ').split())
+    return title[:1].upper() + title[1:]
+
+
 class MediaWikiAPI:
     """Client for MediaWiki API
 
@@ -54,7 +72,8 @@ class MediaWikiAPI:
         self,
         api_url: str,
         username: Optional[str] = None,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        page_cache_size: Optional[int] = None
     ):
         """Initialize MediaWiki API client
 
@@ -62,11 +81,28 @@ class MediaWikiAPI:
             api_url: URL to MediaWiki API endpoint (e.g., https://wiki.example.com/api.php)
             username: Username for authentication (optional)
             password: Password for authentication (optional)
+            page_cache_size: Keep up to this many get_page() results in an
+                             LRU cache (None = no caching). Cached pages are
+                             shared objects and may be stale until
+                             clear_cache(); update_page() drops its title.
+
+        Raises:
+            ValueError: If page_cache_size is not positive
         """
+        if page_cache_size is not None and page_cache_size < 1:
+            raise ValueError(f"page_cache_size must be positive, got {page_cache_size}")
+
         self.api_url = api_url
         self.username = username
         self.password = password
         self._session_token = None
+        self.page_cache_size = page_cache_size
+        self._page_cache: Optional[Dict[str, WikiPage]] = (
+            OrderedDict() if page_cache_size is not None else None  # LRU order, oldest first
+        )
+
+    # MediaWiki accepts at most 50 titles per query (500 with apihighlimits)
+    MAX_TITLES_PER_QUERY = 50
 
     def get_page(self, title: str) -> Optional[WikiPage]:
         """Get page content by title
@@ -77,45 +113,86 @@ class MediaWikiAPI:
         Returns:
             WikiPage object or None if not found
         """
-        # STUB: In production, implement:
-        # response = requests.get(self.api_url, params={
-        #     'action': 'query',
-        #     'titles': title,
-        #     'prop': 'revisions|categories',
-        #     'rvprop': 'content|ids|timestamp',
-        #     'format': 'json'
-        # })
+        cache = self._page_cache
+        if cache is None:
+            pages = self._query_pages([title])
+            return pages[0] if pages else None
+
+        page = cache.get(title)
+        if page is not None:
+            cache.move_to_end(title)
+            return page
+
+        pages = self._query_pages([title])
+        if not pages:
+            return None
 
-        # Simulated response
-        return WikiPage(
-            page_id=12345,
-            title=title,
-            content=f"[Simulated content for: {title}]",
-            revision_id=67890,
-            timestamp="2025-10-26T10:00:00Z",
-            categories=[],
-            metadata={}
-        )
+        page = cache[title] = pages[0]
+        if len(cache) > self.page_cache_size:
+            cache.popitem(last=False)
+        return page
+
+    def clear_cache(self) -> None:
+        """Drop all cached get_page() results"""
+        if self._page_cache is not None:
+            self._page_cache.clear()
 
     def get_pages_batch(self, titles: List[str]) -> List[WikiPage]:
         """Get multiple pages in batch
 
+        Design Decision: One query per MAX_TITLES_PER_QUERY titles via the
+        pipe-separated titles parameter, instead of one round-trip per page.
+
         Args:
             titles: List of page titles
 
         Returns:
             List of WikiPage objects
         """
-        # Batch API call more efficient than multiple individual calls
+        step = self.MAX_TITLES_PER_QUERY
         pages = []
 
-        for title in titles:
-            page = self.get_page(title)
-            if page:
-                pages.append(page)
+        for i in range(0, len(titles), step):
+            pages.extend(self._query_pages(titles[i:i + step]))
 
         return pages
 
+    def _query_pages(self, titles: List[str]) -> List[WikiPage]:
+        """Fetch up to MAX_TITLES_PER_QUERY pages in a single API query
+
+        Args:
+            titles: Page titles
+
+        Returns:
+            WikiPage objects for the pages that exist
+        """
+        # STUB: In production, implement:
+        # response = requests.get(self.api_url, params={
+        #     'action': 'query',
+        #     'titles': '|'.join(titles),
+        #     'prop': 'revisions|categories',
+        #     'rvprop': 'content|ids|timestamp',
+        #     'rvslots': 'main',
+        #     'format': 'json',
+        #     'formatversion': '2'
+        # })
+        # then build one WikiPage per entry of response['query']['pages'],
+        # skipping entries marked 'missing'
+
+        # Simulated response
+        return [
+            WikiPage(
+                page_id=12345,
+                title=title,
+                content=f"[Simulated content for: {title}]",
+                revision_id=67890,
+                timestamp="2025-10-26T10:00:00Z",
+                categories=[],
+                metadata={}
+            )
+            for title in titles
+        ]
+
     def update_page(
         self,
         title: str,
@@ -134,6 +211,9 @@ class MediaWikiAPI:
         Returns:
             True if successful, False otherwise
         """
+        if self._page_cache is not None:
+            self._page_cache.pop(title, None)
+
         # STUB: In production, implement:
         # 1. Get edit token
         # token = self._get_edit_token()
@@ -284,6 +364,9 @@ class GMRKBClient(MediaWikiAPI):
     Extends MediaWikiAPI with GM-RKB specific operations.
     """
 
+    # GMRKBParser keeps no per-parse state, so one instance is shared
+    _parser = GMRKBParser()
+
     def get_research_entity(self, entity_name: str) -> Optional[Dict]:
         """Get research entity from GM-RKB
 
@@ -298,11 +381,44 @@ class GMRKBClient(MediaWikiAPI):
         if not page:
             return None
 
-        # Parse as research entity
-        from .wikitext_parser import GMRKBParser
+        return self._research_entity(page)
+
+    def get_research_entities(self, entity_names: List[str]) -> List[Optional[Dict]]:
+        """Get several research entities with batched page queries
+
+        Results are matched to names after MediaWiki's basic title
+        normalization (underscores to spaces, trimmed, first letter
+        upper-cased), so "foo_bar" finds the page "Foo bar". Other
+        rewrites the API may apply (namespace aliases, redirects) are
+        not mapped back: pass canonical titles to be safe.
+
+        Args:
+            entity_names: Entity names
+
+        Returns:
+            Entity data per name, in input order (None where not found)
+        """
+        pages = {
+            _normalize_title(page.title): page
+            for page in self.get_pages_batch(entity_names)
+        }
 
-        parser = GMRKBParser()
-        entity_data = parser.parse_research_entity(page.content)
+        results = []
+        for name in entity_names:
+            page = pages.get(_normalize_title(name))
+            results.append(self._research_entity(page) if page is not None else None)
+        return results
+
+    def _research_entity(self, page: WikiPage) -> Dict:
+        """Parse a fetched page as a research entity
+
+        Args:
+            page: Fetched page
+
+        Returns:
+            Dictionary with entity data
+        """
+        entity_data = self._parser.parse_research_entity(page.content)
 
         return {
             'page_id': page.page_id,
@@ -349,10 +465,7 @@ class GMRKBClient(MediaWikiAPI):
             return []
 
         # Extract links as related entities
-        from .wikitext_parser import GMRKBParser
-
-        parser = GMRKBParser()
-        links = parser.extract_links(page.content)
+        links = self._parser.extract_links(page.content)
 
         # Filter by relationship type if specified
         if relationship_type:
@@ -366,15 +479,25 @@ class GMRKBClient(MediaWikiAPI):
 class BatchProcessor:
     """Batch operations for MediaWiki pages"""
 
-    def __init__(self, api_client: MediaWikiAPI, batch_size: int = 50):
+    def __init__(
+        self,
+        api_client: MediaWikiAPI,
+        batch_size: int = 50,
+        executor: Optional[Executor] = None
+    ):
         """Initialize batch processor
 
         Args:
             api_client: MediaWiki API client
             batch_size: Number of pages per batch
+            executor: Optional executor for fetching the next batch while
+                      the current one is processed, and for processing the
+                      pages of a batch concurrently (useful when the API
+                      and processor_func are I/O-bound)
         """
         self.api_client = api_client
         self.batch_size = batch_size
+        self.executor = executor
 
     def process_category(
         self,
@@ -403,22 +526,77 @@ class BatchProcessor:
             'errors': []
         }
 
-        # Process in batches
-        for i in range(0, len(page_titles), self.batch_size):
-            batch = page_titles[i:i + self.batch_size]
-            pages = self.api_client.get_pages_batch(batch)
-
-            for page in pages:
-                try:
-                    processor_func(page)
-                    results['succeeded'] += 1
-                except Exception as e:
-                    results['failed'] += 1
-                    results['errors'].append({
-                        'page': page.title,
-                        'error': str(e)
-                    })
+        batches = [
+            page_titles[i:i + self.batch_size]
+            for i in range(0, len(page_titles), self.batch_size)
+        ]
 
-                results['processed'] += 1
+        if self.executor is None:
+            # Process in batches
+            for batch in batches:
+                pages = self.api_client.get_pages_batch(batch)
+                errors = [self._process_page(processor_func, page) for page in pages]
+                self._record_batch(results, pages, errors)
+            return results
+
+        # Pipelined: batch N+1 is fetched while batch N's pages are
+        # processed. Outcomes are recorded in page order on this thread,
+        # so results match the serial path.
+        executor = self.executor
+        get_pages_batch = self.api_client.get_pages_batch
+        next_pages = executor.submit(get_pages_batch, batches[0]) if batches else None
+
+        for index in range(len(batches)):
+            pages = next_pages.result()
+            if index + 1 < len(batches):
+                next_pages = executor.submit(get_pages_batch, batches[index + 1])
+
+            errors = list(executor.map(
+                lambda page: self._process_page(processor_func, page),
+                pages
+            ))
+            self._record_batch(results, pages, errors)
 
         return results
+
+    @staticmethod
+    def _process_page(processor_func: callable, page: WikiPage) -> Optional[str]:
+        """Run processor_func on one page
+
+        Args:
+            processor_func: Function to process the page
+            page: Page to process
+
+        Returns:
+            Error message if processing raised, None on success
+        """
+        try:
+            processor_func(page)
+        except Exception as e:
+            return str(e)
+        return None
+
+    @staticmethod
+    def _record_batch(
+        results: Dict[str, Any],
+        pages: List[WikiPage],
+        errors: List[Optional[str]]
+    ) -> None:
+        """Add one batch's outcomes to the running results
+
+        Args:
+            results: Results dictionary being built by process_category
+            pages: Pages of the batch
+            errors: Per-page error message (None for success)
+        """
+        for page, error in zip(pages, errors):
+            if error is None:
+                results['succeeded'] += 1
+            else:
+                results['failed'] += 1
+                results['errors'].append({
+                    'page': page.title,
+                    'error': error
+                })
+
+            results['processed'] += 1